@@ -0,0 +1,331 @@
+import hashlib
+import json
+
+import numpy as np
+
+STYLES = ['Visual', 'Auditory', 'Kinesthetic']
+LEVELS = ['Beginner', 'Intermediate', 'Advanced']
+DIMENSIONS = STYLES + LEVELS
+
+
+class QuestionBank:
+    """Assessment questions compiled into an array-backed weight matrix.
+
+    ``weights[row, option]`` holds the option's contribution to each learning
+    style and skill level, so scoring an answer sheet is a fancy-indexed
+    lookup followed by a sum. ``version`` is a content hash of the questions;
+    assessments store it instead of a full copy of the bank.
+    """
+
+    def __init__(self, questions):
+        self.questions = questions
+        canonical = json.dumps(questions, sort_keys=True, separators=(',', ':'))
+        self.version = hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:16]
+        self.definition = canonical
+
+        self.row_of = {question['id']: row for row, question in enumerate(questions)}
+        self.option_counts = np.array([len(question['options']) for question in questions])
+        self.weights = np.zeros((len(questions), self.option_counts.max(initial=0), len(DIMENSIONS)))
+        for row, question in enumerate(questions):
+            for column, option in enumerate(question['options']):
+                for key in ('style', 'level'):
+                    if option.get(key) in DIMENSIONS:
+                        self.weights[row, column, DIMENSIONS.index(option[key])] += option['weight']
+
+    def _lookup(self, answers):
+        try:
+            rows = np.array([self.row_of[answer['question_id']] for answer in answers], dtype=np.intp)
+        except KeyError as e:
+            raise ValueError(f'Unknown question id {e.args[0]}')
+        options = np.array([answer['selected_option'] for answer in answers], dtype=np.intp)
+        if ((options < 0) | (options >= self.option_counts[rows])).any():
+            raise ValueError('Selected option out of range')
+        return rows, options
+
+    def score(self, answers):
+        """Total weight per dimension for one answer sheet"""
+        if not answers:
+            return np.zeros(len(DIMENSIONS))
+        rows, options = self._lookup(answers)
+        return self.weights[rows, options].sum(axis=0)
+
+    def score_many(self, answer_sheets):
+        """Score many answer sheets at once; returns a ``len(sheets) x dimensions`` array"""
+        sheet_index = np.repeat(np.arange(len(answer_sheets)), [len(sheet) for sheet in answer_sheets])
+        totals = np.zeros((len(answer_sheets), len(DIMENSIONS)))
+        answers = [answer for sheet in answer_sheets for answer in sheet]
+        if answers:
+            rows, options = self._lookup(answers)
+            np.add.at(totals, sheet_index, self.weights[rows, options])
+        return totals
+
+    @staticmethod
+    def results(totals):
+        """Turn a row of dimension totals into the stored assessment results"""
+        style_scores = {style: int(totals[i]) for i, style in enumerate(STYLES)}
+        level_scores = {level: int(totals[len(STYLES) + i]) for i, level in enumerate(LEVELS)}
+        return {
+            'learning_style': max(style_scores, key=style_scores.get),
+            'skill_level': max(level_scores, key=level_scores.get) if any(level_scores.values()) else 'Beginner',
+            'style_scores': style_scores,
+            'level_scores': level_scores
+        }
+
+
+# Multiple-choice knowledge items for the adaptive test, with 2PL parameters:
+# ``a`` is the discrimination and ``b`` the difficulty on the ability scale.
+# The parameters are starting estimates; recalibrate them from stored responses.
+SKILL_ITEMS = [
+    {'id': 101, 'topic': 'Programming', 'a': 1.1, 'b': -2.3,
+     'question': 'What does a variable do in a program?',
+     'options': ['Stores a value under a name', 'Draws the user interface', 'Connects to the internet', 'Compiles the code'],
+     'answer': 0},
+    {'id': 102, 'topic': 'Programming', 'a': 1.0, 'b': -2.0,
+     'question': 'Which of these is a loop construct in most languages?',
+     'options': ['if', 'for', 'return', 'import'],
+     'answer': 1},
+    {'id': 103, 'topic': 'Web', 'a': 1.2, 'b': -1.9,
+     'question': 'What is HTML mainly used for?',
+     'options': ['Styling pages', 'Structuring page content', 'Querying databases', 'Running servers'],
+     'answer': 1},
+    {'id': 104, 'topic': 'Data', 'a': 0.9, 'b': -1.8,
+     'question': 'What does a spreadsheet formula like =SUM(A1:A3) return?',
+     'options': ['The largest of the three cells', 'The total of the three cells', 'The number of cells', 'The first cell'],
+     'answer': 1},
+    {'id': 105, 'topic': 'Programming', 'a': 1.3, 'b': -1.6,
+     'question': 'In Python, what does len([1, 2, 3]) return?',
+     'options': ['2', '3', '6', 'An error'],
+     'answer': 1},
+    {'id': 106, 'topic': 'Tools', 'a': 1.0, 'b': -1.4,
+     'question': 'What is Git used for?',
+     'options': ['Version control', 'Image editing', 'Hosting databases', 'Writing tests'],
+     'answer': 0},
+    {'id': 107, 'topic': 'Web', 'a': 1.1, 'b': -1.3,
+     'question': 'Which language runs natively in web browsers?',
+     'options': ['Python', 'Java', 'JavaScript', 'C#'],
+     'answer': 2},
+    {'id': 108, 'topic': 'Data', 'a': 1.2, 'b': -1.1,
+     'question': 'Which SQL keyword filters rows?',
+     'options': ['ORDER BY', 'WHERE', 'GROUP BY', 'SELECT'],
+     'answer': 1},
+    {'id': 109, 'topic': 'Programming', 'a': 1.4, 'b': -0.9,
+     'question': 'What is the value of 7 // 2 in Python?',
+     'options': ['3.5', '3', '4', '1'],
+     'answer': 1},
+    {'id': 110, 'topic': 'Programming', 'a': 1.2, 'b': -0.8,
+     'question': 'What is a function parameter?',
+     'options': ['A value passed into the function', 'The value the function returns', 'A global constant', 'A comment'],
+     'answer': 0},
+    {'id': 111, 'topic': 'Data', 'a': 1.0, 'b': -0.6,
+     'question': 'Which chart best shows a trend over time?',
+     'options': ['Pie chart', 'Line chart', 'Scatter plot of unrelated values', 'Word cloud'],
+     'answer': 1},
+    {'id': 112, 'topic': 'Web', 'a': 1.3, 'b': -0.5,
+     'question': 'Which HTTP method is conventionally used to create a resource?',
+     'options': ['GET', 'POST', 'HEAD', 'OPTIONS'],
+     'answer': 1},
+    {'id': 113, 'topic': 'Programming', 'a': 1.5, 'b': -0.3,
+     'question': 'What does this print? x = [1, 2]; y = x; y.append(3); print(len(x))',
+     'options': ['2', '3', '1', 'An error'],
+     'answer': 1},
+    {'id': 114, 'topic': 'Data', 'a': 1.3, 'b': -0.2,
+     'question': 'Which SQL clause is needed to count rows per category?',
+     'options': ['HAVING', 'GROUP BY', 'LIMIT', 'DISTINCT'],
+     'answer': 1},
+    {'id': 115, 'topic': 'Tools', 'a': 1.1, 'b': -0.1,
+     'question': 'What does git merge do?',
+     'options': ['Deletes a branch', 'Combines the history of two branches', 'Uploads commits', 'Reverts a commit'],
+     'answer': 1},
+    {'id': 116, 'topic': 'Programming', 'a': 1.6, 'b': 0.0,
+     'question': 'What is the time complexity of looking up a key in a Python dict on average?',
+     'options': ['O(1)', 'O(log n)', 'O(n)', 'O(n log n)'],
+     'answer': 0},
+    {'id': 117, 'topic': 'Web', 'a': 1.2, 'b': 0.1,
+     'question': 'What does a 404 status code mean?',
+     'options': ['Server error', 'Not found', 'Unauthorized', 'Redirect'],
+     'answer': 1},
+    {'id': 118, 'topic': 'Data', 'a': 1.4, 'b': 0.2,
+     'question': 'A model scores well on training data but poorly on new data. This is called:',
+     'options': ['Underfitting', 'Overfitting', 'Regularization', 'Normalization'],
+     'answer': 1},
+    {'id': 119, 'topic': 'Programming', 'a': 1.5, 'b': 0.4,
+     'question': 'What does a Python generator do differently from a function returning a list?',
+     'options': ['Runs faster on every input', 'Produces values lazily, one at a time', 'Sorts its output', 'Runs in a separate process'],
+     'answer': 1},
+    {'id': 120, 'topic': 'Web', 'a': 1.3, 'b': 0.5,
+     'question': 'In React, what causes a component to re-render?',
+     'options': ['A change to its state or props', 'Any CSS change', 'A server restart', 'Reading a variable'],
+     'answer': 0},
+    {'id': 121, 'topic': 'Data', 'a': 1.2, 'b': 0.6,
+     'question': 'Which metric suits a classifier on a heavily imbalanced dataset better than accuracy?',
+     'options': ['F1 score', 'Mean squared error', 'R squared', 'Row count'],
+     'answer': 0},
+    {'id': 122, 'topic': 'Data', 'a': 1.6, 'b': 0.8,
+     'question': 'What does a database index trade for faster reads?',
+     'options': ['Slower writes and extra storage', 'Less durability', 'Fewer columns', 'Weaker consistency'],
+     'answer': 0},
+    {'id': 123, 'topic': 'Programming', 'a': 1.4, 'b': 0.9,
+     'question': 'What does a closure capture?',
+     'options': ['Variables from its enclosing scope', 'Only global variables', 'A copy of the call stack', 'Nothing; it is a syntax error'],
+     'answer': 0},
+    {'id': 124, 'topic': 'Web', 'a': 1.3, 'b': 1.0,
+     'question': 'Which mechanism lets a browser call an API on another origin?',
+     'options': ['CSRF tokens', 'CORS headers', 'Cookies with HttpOnly', 'Service workers'],
+     'answer': 1},
+    {'id': 125, 'topic': 'Tools', 'a': 1.1, 'b': 1.1,
+     'question': 'What is the main benefit of running an app in a Docker container?',
+     'options': ['The same environment everywhere it runs', 'Faster CPUs', 'Automatic scaling', 'No need for configuration'],
+     'answer': 0},
+    {'id': 126, 'topic': 'Data', 'a': 1.5, 'b': 1.2,
+     'question': 'What does regularization in a linear model do?',
+     'options': ['Penalizes large weights to reduce overfitting', 'Removes outliers', 'Scales the features', 'Adds training data'],
+     'answer': 0},
+    {'id': 127, 'topic': 'Programming', 'a': 1.7, 'b': 1.3,
+     'question': 'Why can CPU-bound Python threads fail to run in parallel?',
+     'options': ['The global interpreter lock', 'Threads are not supported', 'The garbage collector', 'Stack size limits'],
+     'answer': 0},
+    {'id': 128, 'topic': 'Data', 'a': 1.4, 'b': 1.4,
+     'question': 'Two transactions each read a row and then update it. Without locking, which anomaly can occur?',
+     'options': ['Lost update', 'Phantom column', 'Deadlock on read', 'Schema drift'],
+     'answer': 0},
+    {'id': 129, 'topic': 'Web', 'a': 1.2, 'b': 1.5,
+     'question': 'What does an ETag enable?',
+     'options': ['Conditional requests that skip unchanged bodies', 'Encryption of responses', 'Server push', 'Load balancing'],
+     'answer': 0},
+    {'id': 130, 'topic': 'Programming', 'a': 1.5, 'b': 1.7,
+     'question': 'What is the worst-case time complexity of quicksort?',
+     'options': ['O(n log n)', 'O(n^2)', 'O(n)', 'O(log n)'],
+     'answer': 1},
+    {'id': 131, 'topic': 'Data', 'a': 1.3, 'b': 1.8,
+     'question': 'What does the attention mechanism in a transformer compute?',
+     'options': ['Weighted combinations of token representations', 'Gradients for the optimizer', 'Token frequencies', 'The vocabulary'],
+     'answer': 0},
+    {'id': 132, 'topic': 'Tools', 'a': 1.2, 'b': 1.9,
+     'question': 'What does a Kubernetes readiness probe control?',
+     'options': ['Whether a pod receives traffic', 'Whether a pod is restarted', 'How many replicas run', 'Which node a pod runs on'],
+     'answer': 0},
+    {'id': 133, 'topic': 'Programming', 'a': 1.4, 'b': 2.0,
+     'question': 'Which structure gives O(log n) insert and O(1) access to the minimum?',
+     'options': ['Binary heap', 'Hash table', 'Linked list', 'Sorted array'],
+     'answer': 0},
+    {'id': 134, 'topic': 'Data', 'a': 1.3, 'b': 2.2,
+     'question': 'Which isolation level prevents non-repeatable reads but allows phantoms under the SQL standard?',
+     'options': ['Read committed', 'Repeatable read', 'Serializable', 'Read uncommitted'],
+     'answer': 1},
+    {'id': 135, 'topic': 'Web', 'a': 1.1, 'b': 2.3,
+     'question': 'Why does HTTP/2 reduce the need for domain sharding?',
+     'options': ['It multiplexes many requests on one connection', 'It compresses images', 'It removes TLS', 'It caches DNS lookups'],
+     'answer': 0},
+    {'id': 136, 'topic': 'Programming', 'a': 1.2, 'b': 2.5,
+     'question': 'What does amortized O(1) append for a dynamic array rely on?',
+     'options': ['Growing capacity geometrically', 'Preallocating the maximum size', 'Linked storage', 'Copy-on-write'],
+     'answer': 0},
+]
+
+# Ability cut points between skill levels
+LEVEL_CUTS = ((-0.5, 'Beginner'), (0.8, 'Intermediate'))
+
+
+def level_for(theta):
+    for cut, level in LEVEL_CUTS:
+        if theta < cut:
+            return level
+    return 'Advanced'
+
+
+class AdaptiveItemBank:
+    """2PL item bank for computerized adaptive testing.
+
+    Response probabilities and item information are precomputed on a fixed
+    grid of ability values. For each grid point the items are pre-sorted by
+    information, so choosing the next item is a lookup at the grid point
+    nearest the current estimate that skips the few items already asked.
+    Ability is the expected a posteriori (EAP) estimate under a normal prior;
+    its posterior standard deviation is the standard error used to stop.
+    """
+
+    def __init__(self, items, se_target=0.4, min_items=5, max_items=20, grid_points=81, grid_range=4.0):
+        self.items = items
+        canonical = json.dumps(items, sort_keys=True, separators=(',', ':'))
+        self.version = hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:16]
+        self.definition = canonical
+        self.se_target = se_target
+        self.min_items = min_items
+        self.max_items = min(max_items, len(items))
+
+        self.row_of = {item['id']: row for row, item in enumerate(items)}
+        a = np.array([item['a'] for item in items], dtype=np.float64)[:, None]
+        b = np.array([item['b'] for item in items], dtype=np.float64)[:, None]
+        self.grid = np.linspace(-grid_range, grid_range, grid_points)
+        self._step = self.grid[1] - self.grid[0]
+        p = 1 / (1 + np.exp(-a * (self.grid - b)))
+        self.log_p = np.log(p)
+        self.log_q = np.log1p(-p)
+        self.information = a ** 2 * p * (1 - p)
+        # ranked[g] lists item rows from most to least informative at grid[g]
+        self.ranked = np.argsort(-self.information, axis=0, kind='stable').T
+        self.log_prior = -self.grid ** 2 / 2
+
+    def grid_index(self, theta):
+        return int(min(max(round((theta - self.grid[0]) / self._step), 0), len(self.grid) - 1))
+
+    def estimate(self, responses):
+        """``(theta, standard_error)`` from ``[(item_id, correct), ...]``"""
+        log_posterior = self.log_prior.copy()
+        if responses:
+            rows = np.array([self.row_of[item_id] for item_id, _ in responses], dtype=np.intp)
+            correct = np.array([bool(value) for _, value in responses])
+            log_posterior += self.log_p[rows[correct]].sum(axis=0) + self.log_q[rows[~correct]].sum(axis=0)
+        weights = np.exp(log_posterior - log_posterior.max())
+        weights /= weights.sum()
+        theta = float(weights @ self.grid)
+        return theta, float(np.sqrt(weights @ (self.grid - theta) ** 2))
+
+    def next_item(self, theta, asked):
+        """The unasked item with the most information at ``theta``, or None"""
+        asked = {self.row_of[item_id] for item_id in asked}
+        for row in self.ranked[self.grid_index(theta)]:
+            if row not in asked:
+                return self.items[row]
+        return None
+
+    def finished(self, answered, standard_error):
+        if answered >= self.max_items:
+            return True
+        return answered >= self.min_items and standard_error <= self.se_target
+
+    def step(self, responses):
+        """Estimate ability and decide what comes next
+
+        Returns ``{'theta', 'standard_error', 'done', 'item'}``, where ``item``
+        is the next item to ask (None once the test is done).
+        """
+        theta, standard_error = self.estimate(responses)
+        done = self.finished(len(responses), standard_error)
+        item = None if done else self.next_item(theta, [item_id for item_id, _ in responses])
+        return {'theta': theta, 'standard_error': standard_error, 'done': done or item is None, 'item': item}
+
+    def score(self, item_id, selected_option):
+        """Whether ``selected_option`` answers the item correctly"""
+        row = self.row_of.get(item_id)
+        if row is None:
+            raise ValueError(f'Unknown item id {item_id}')
+        item = self.items[row]
+        if not 0 <= selected_option < len(item['options']):
+            raise ValueError('Selected option out of range')
+        return selected_option == item['answer']
+
+    @staticmethod
+    def public(item):
+        """The item as shown to the user, without its answer or parameters"""
+        return {'id': item['id'], 'topic': item['topic'], 'question': item['question'], 'options': item['options']}
+
+    def results(self, responses):
+        theta, standard_error = self.estimate(responses)
+        return {
+            'skill_level': level_for(theta),
+            'theta': round(theta, 3),
+            'standard_error': round(standard_error, 3),
+            'items_answered': len(responses),
+            'correct': sum(bool(correct) for _, correct in responses)
+        }
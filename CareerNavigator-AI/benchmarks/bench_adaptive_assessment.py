@@ -0,0 +1,87 @@
+"""Simulate the adaptive skill test over synthetic respondents.
+
+Each respondent has a true ability drawn from N(0, 1) and answers according to
+the 2PL model of the item bank. Reports questions to convergence, estimation
+error, how often the adaptive test assigns the same skill level as the full
+bank would, and the cost of one selection step.
+
+    python benchmarks/bench_adaptive_assessment.py --respondents 10000 --se-target 0.4
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from assessment import SKILL_ITEMS, AdaptiveItemBank, level_for
+
+
+def respond(rng, item, theta):
+    probability = 1 / (1 + np.exp(-item['a'] * (theta - item['b'])))
+    return int(rng.random() < probability)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--respondents', type=int, default=5000)
+    parser.add_argument('--se-target', type=float, default=0.4)
+    parser.add_argument('--min-items', type=int, default=5)
+    parser.add_argument('--max-items', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    bank = AdaptiveItemBank(SKILL_ITEMS, se_target=args.se_target, min_items=args.min_items, max_items=args.max_items)
+    full_bank = AdaptiveItemBank(SKILL_ITEMS, min_items=len(SKILL_ITEMS), max_items=len(SKILL_ITEMS))
+
+    lengths, errors, full_errors, step_seconds = [], [], [], []
+    converged = same_level = true_level = 0
+    for _ in range(args.respondents):
+        theta = rng.normal()
+        answers = {item['id']: respond(rng, item, theta) for item in SKILL_ITEMS}
+
+        responses = []
+        while True:
+            start = time.perf_counter()
+            step = bank.step(responses)
+            step_seconds.append(time.perf_counter() - start)
+            if step['done']:
+                break
+            responses.append((step['item']['id'], answers[step['item']['id']]))
+
+        full_theta, _ = full_bank.estimate(list(answers.items()))
+        lengths.append(len(responses))
+        errors.append(step['theta'] - theta)
+        full_errors.append(full_theta - theta)
+        converged += step['standard_error'] <= args.se_target
+        same_level += level_for(step['theta']) == level_for(full_theta)
+        true_level += level_for(step['theta']) == level_for(theta)
+
+    lengths.sort()
+    step_seconds.sort()
+    print(json.dumps({
+        'benchmark': 'adaptive_assessment',
+        'respondents': args.respondents,
+        'item_bank_size': len(SKILL_ITEMS),
+        'se_target': args.se_target,
+        'max_items': bank.max_items,
+        'mean_questions': round(statistics.mean(lengths), 2),
+        'p50_questions': lengths[len(lengths) // 2],
+        'p95_questions': lengths[int(len(lengths) * 0.95) - 1],
+        'converged_share': round(converged / args.respondents, 4),
+        'rmse_adaptive': round(float(np.sqrt(np.mean(np.square(errors)))), 4),
+        'rmse_full_bank': round(float(np.sqrt(np.mean(np.square(full_errors)))), 4),
+        'level_agreement_with_full_bank': round(same_level / args.respondents, 4),
+        'level_accuracy': round(true_level / args.respondents, 4),
+        'step_p50_us': round(statistics.median(step_seconds) * 1e6, 2),
+        'step_p99_us': round(step_seconds[int(len(step_seconds) * 0.99) - 1] * 1e6, 2)
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,344 @@
+"""Load-test the main API endpoints and micro-benchmark the scoring hot paths.
+
+The app is booted in-process against a throwaway SQLite database (or
+DATABASE_URL, e.g. a local PostgreSQL) seeded with synthetic users, courses,
+jobs and skills, with the fake Gemini model. Endpoints are driven over HTTP
+at a fixed concurrency, by default against a threaded server started here;
+pass --url to target a server such as gunicorn running on the same database.
+Results are printed as JSON and written to --output for comparison across
+commits.
+
+    python benchmarks/bench_api.py --users 2000 --jobs 5000 --concurrency 16 --output results.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, APP_DIR)
+
+PASSWORD = 'bench-password'
+ENDPOINTS = ['login', 'courses', 'jobs', 'leaderboard', 'assessment_submit']
+TITLES = ['Engineer', 'Developer', 'Analyst', 'Scientist', 'Architect', 'Intern']
+STYLES = ['Visual', 'Auditory', 'Kinesthetic']
+LEVELS = ['Beginner', 'Intermediate', 'Advanced']
+
+
+def percentile(values, share):
+    return values[max(int(len(values) * share) - 1, 0)]
+
+
+def latency_summary(latencies):
+    latencies = sorted(latencies)
+    if not latencies:
+        return {}
+    return {
+        'p50_ms': round(statistics.median(latencies) * 1000, 3),
+        'p95_ms': round(percentile(latencies, 0.95) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 3),
+        'max_ms': round(latencies[-1] * 1000, 3)
+    }
+
+
+def seed(application, rng, args):
+    """Insert the synthetic data set unless a previous run already did"""
+    from sqlalchemy import insert
+    from werkzeug.security import generate_password_hash
+
+    db = application.db
+    application.create_tables()
+    if application.User.query.filter(application.User.email.like('bench-%')).count():
+        return False
+
+    # Canonical names and aliases, so requirement strings look like real postings
+    skill_terms = [term for name, aliases in application.SKILL_VOCABULARY.items() for term in [name] + aliases]
+    skill_names = list(application.SKILL_VOCABULARY)
+    # Hashing is deliberately slow, so every user shares one hash
+    password_hash = generate_password_hash(PASSWORD)
+
+    db.session.execute(insert(application.Course), [
+        {
+            'title': f'{rng.choice(skill_names)} {rng.choice(["Fundamentals", "in Practice", "Deep Dive"])} {i}',
+            'description': f'Learn {", ".join(rng.sample(skill_terms, 3))} through projects',
+            'difficulty': rng.choice(LEVELS),
+            'category': rng.choice(['Programming', 'Web Development', 'Data Science', 'Cloud']),
+            'duration': f'{rng.randint(2, 12)} weeks',
+            'skills_taught': json.dumps(rng.sample(skill_names, rng.randint(2, 5))),
+            'content': 'Synthetic benchmark course'
+        }
+        for i in range(args.courses)
+    ])
+    db.session.execute(insert(application.Job), [
+        {
+            'title': f'{rng.choice(skill_names)} {rng.choice(TITLES)}',
+            'company': f'Company {rng.randrange(args.jobs // 10 + 1)}',
+            'description': 'Synthetic benchmark job',
+            'requirements': ', '.join(rng.sample(skill_terms, rng.randint(3, 8))),
+            'location': 'Remote',
+            'job_type': 'Full-time'
+        }
+        for _ in range(args.jobs)
+    ])
+    db.session.execute(insert(application.User), [
+        {
+            'email': f'bench-{i}@example.com',
+            'password_hash': password_hash,
+            'full_name': f'Bench User {i}',
+            'learning_style': rng.choice(STYLES),
+            'skill_level': rng.choice(LEVELS),
+            'points': rng.randrange(0, 5000, 50)
+        }
+        for i in range(args.users)
+    ])
+    user_ids = [user_id for (user_id,) in db.session.query(application.User.id).filter(
+        application.User.email.like('bench-%')
+    )]
+    db.session.execute(insert(application.UserSkill), [
+        {'user_id': user_id, 'skill_name': skill, 'proficiency_level': rng.randint(1, 5)}
+        for user_id in user_ids
+        for skill in rng.sample(skill_names, rng.randint(3, 10))
+    ])
+    db.session.commit()
+
+    # Core inserts skip the ORM hooks, so derive what they would have maintained
+    application.refresh_skill_ids(only_missing=True)
+    application.backfill_user_stats()
+    application.tfidf_scorer.fit(db.session.query(application.Job.id, application.Job.requirements))
+    application.load_leaderboard()
+    application.course_catalog.invalidate()
+    return True
+
+
+class Client:
+    def __init__(self, base_url):
+        self.base_url = base_url.rstrip('/')
+
+    def request(self, method, path, body=None, token=None):
+        """Return ``(status, seconds, body)``; reading the body is part of the timing"""
+        headers = {'Content-Type': 'application/json'}
+        if token:
+            headers['Authorization'] = f'Bearer {token}'
+        data = json.dumps(body).encode() if body is not None else None
+        req = urllib.request.Request(self.base_url + path, data=data, headers=headers, method=method)
+        start = time.perf_counter()
+        try:
+            with urllib.request.urlopen(req, timeout=60) as response:
+                payload = response.read()
+                status = response.status
+        except urllib.error.HTTPError as e:
+            payload = e.read()
+            status = e.code
+        return status, time.perf_counter() - start, payload
+
+
+def scenario(name, rng, users, questions):
+    """Build one request for an endpoint: ``(method, path, body, token)``"""
+    email, token = rng.choice(users)
+    if name == 'login':
+        return 'POST', '/api/login', {'email': email, 'password': PASSWORD}, None
+    if name == 'courses':
+        return 'GET', '/api/courses', None, token
+    if name == 'jobs':
+        return 'GET', '/api/jobs/recommendations', None, token
+    if name == 'leaderboard':
+        return 'GET', '/api/leaderboard?limit=10', None, token
+    if name == 'assessment_submit':
+        answers = [
+            {'question_id': question['id'], 'selected_option': rng.randrange(len(question['options']))}
+            for question in questions
+        ]
+        return 'POST', '/api/assessment/submit', {'answers': answers}, token
+    raise ValueError(f'Unknown endpoint {name}')
+
+
+def load_test(client, name, users, questions, args):
+    rng = random.Random(args.seed)
+    # Requests are built up front so the timed loop only sends them
+    planned = [scenario(name, rng, users, questions) for _ in range(args.requests + args.warmup)]
+    warmup, planned = planned[:args.warmup], planned[args.warmup:]
+    for method, path, body, token in warmup:
+        client.request(method, path, body, token)
+
+    lock = threading.Lock()
+    latencies, statuses = [], {}
+    cursor = iter(planned)
+
+    def worker():
+        while True:
+            with lock:
+                item = next(cursor, None)
+            if item is None:
+                return
+            try:
+                status, seconds, _ = client.request(*item)
+            except Exception as e:
+                status, seconds = type(e).__name__, None
+            with lock:
+                statuses[str(status)] = statuses.get(str(status), 0) + 1
+                if seconds is not None:
+                    latencies.append(seconds)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        for _ in range(args.concurrency):
+            executor.submit(worker)
+    elapsed = time.perf_counter() - start
+
+    errors = sum(count for status, count in statuses.items() if not status.startswith('2'))
+    return dict(
+        latency_summary(latencies),
+        requests=len(planned),
+        errors=errors,
+        statuses=statuses,
+        requests_per_second=round(len(planned) / elapsed, 1)
+    )
+
+
+def time_calls(function, inputs, repeat):
+    """Per-call latency summary of ``function`` over ``inputs``, cycled ``repeat`` times"""
+    latencies = []
+    for _ in range(repeat):
+        for item in inputs:
+            start = time.perf_counter()
+            function(item)
+            latencies.append(time.perf_counter() - start)
+    total = sum(latencies)
+    summary = {key.replace('_ms', '_us'): round(value * 1000, 2) for key, value in latency_summary(latencies).items()}
+    return dict(summary, calls=len(latencies), calls_per_second=round(len(latencies) / total, 1) if total else None)
+
+
+def micro_benchmarks(application, rng, args):
+    with application.app.app_context():
+        user_ids = [user_id for (user_id,) in application.db.session.query(application.User.id).limit(200)]
+        requirements = [text for (text,) in application.db.session.query(application.Job.requirements).limit(1000)]
+        profiles = [[name for name, _ in application.load_user_skills(user_id)] for user_id in user_ids]
+    pairs = [(rng.choice(profiles), rng.choice(requirements)) for _ in range(args.micro_calls)]
+    profiles = [profile for profile, _ in pairs]
+    questions = application.ASSESSMENT_QUESTIONS
+    sheets = [
+        [{'question_id': q['id'], 'selected_option': rng.randrange(len(q['options']))} for q in questions]
+        for _ in range(args.micro_calls)
+    ]
+    bank = application.question_bank
+
+    start = time.perf_counter()
+    bank.score_many(sheets)
+    batch_seconds = time.perf_counter() - start
+    return {
+        'calculate_job_match_score': time_calls(
+            lambda pair: application.calculate_job_match_score(*pair), pairs, args.micro_repeat
+        ),
+        'tfidf_rank': time_calls(
+            lambda profile: application.tfidf_scorer.rank(application.canonical_skill_names([profile]), k=10),
+            profiles, args.micro_repeat
+        ),
+        'assessment_scoring': time_calls(lambda sheet: bank.results(bank.score(sheet)), sheets, args.micro_repeat),
+        'assessment_scoring_batch': {
+            'sheets': len(sheets),
+            'total_ms': round(batch_seconds * 1000, 3),
+            'sheets_per_second': round(len(sheets) / batch_seconds, 1) if batch_seconds else None
+        }
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=APP_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, default=1000)
+    parser.add_argument('--courses', type=int, default=500)
+    parser.add_argument('--jobs', type=int, default=5000)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--requests', type=int, default=500, help='Timed requests per endpoint')
+    parser.add_argument('--warmup', type=int, default=20, help='Untimed requests per endpoint')
+    parser.add_argument('--token-users', type=int, default=50, help='Users that log in up front and send requests')
+    parser.add_argument('--endpoints', nargs='+', default=ENDPOINTS, choices=ENDPOINTS)
+    parser.add_argument('--micro-calls', type=int, default=2000)
+    parser.add_argument('--micro-repeat', type=int, default=3)
+    parser.add_argument('--url', help='Benchmark a running server instead of an in-process one')
+    parser.add_argument('--output', help='Also write the results to this JSON file')
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='bench-api-')
+    os.environ.setdefault('GEMINI_STUB', '1')
+    os.environ.setdefault('DATABASE_URL', f"sqlite:///{os.path.join(workdir, 'bench.db')}")
+    os.environ.setdefault('JOB_INDEX_PATH', os.path.join(workdir, 'job_index.faiss'))
+    # Models load after seeding so the job index is built over the synthetic jobs
+    os.environ.setdefault('MODEL_WARMUP', 'lazy')
+    import app as application
+
+    rng = random.Random(args.seed)
+    start = time.perf_counter()
+    with application.app.app_context():
+        seeded = seed(application, rng, args)
+        application.models.warm(background=False)
+        emails = [email for (email,) in application.db.session.query(application.User.email).filter(
+            application.User.email.like('bench-%')
+        )]
+        database = application.db.engine.dialect.name
+    application._app_initialized.set()
+    setup_seconds = time.perf_counter() - start
+
+    server = None
+    if args.url:
+        client = Client(args.url)
+    else:
+        from werkzeug.serving import make_server
+        server = make_server('127.0.0.1', 0, application.app, threaded=True)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        client = Client(f'http://127.0.0.1:{server.server_port}')
+
+    users = []
+    for email in rng.sample(emails, min(args.token_users, len(emails))):
+        status, _, payload = client.request('POST', '/api/login', {'email': email, 'password': PASSWORD})
+        if status != 200:
+            raise SystemExit(f'Login failed for {email}: {status} {payload[:200]!r}')
+        users.append((email, json.loads(payload)['token']))
+
+    endpoints = {
+        name: load_test(client, name, users, application.ASSESSMENT_QUESTIONS, args)
+        for name in args.endpoints
+    }
+    if server is not None:
+        server.shutdown()
+
+    results = {
+        'benchmark': 'api',
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'database': database,
+        'scale': {'users': args.users, 'courses': args.courses, 'jobs': args.jobs, 'seeded': seeded},
+        'setup_s': round(setup_seconds, 2),
+        'concurrency': args.concurrency,
+        'target': args.url or 'in-process',
+        'models': {name: status['state'] for name, status in application.models.status().items()},
+        'endpoints': endpoints,
+        'micro': micro_benchmarks(application, rng, args)
+    }
+    print(json.dumps(results, indent=2))
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""Benchmark chat prompt size and latency per turn as a conversation grows.
+
+Drives /api/chat in-process against a throwaway SQLite database and the fake
+Gemini model, for one user with skills and course progress. For every turn it
+records the estimated prompt tokens, the time to build the prompt and the
+request latency, next to the size a prompt replaying the whole history would
+have. Results are reported per block of turns.
+
+    python benchmarks/bench_chat_memory.py --turns 500 --block 50
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+QUESTIONS = [
+    'How should I prepare for a data analyst interview?',
+    'Which course should I take after Python Fundamentals?',
+    'Can you review my plan to learn React in six weeks? I can study about ten hours a week.',
+    'What salary range is realistic for a junior developer in my area?',
+    'I finished the SQL module. What projects would show it off on my resume?',
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--turns', type=int, default=300)
+    parser.add_argument('--block', type=int, default=50)
+    parser.add_argument('--llm-latency', type=float, default=0.005, help='Seconds per fake model call')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='bench-chat-')
+    os.environ.setdefault('GEMINI_STUB', '1')
+    os.environ.setdefault('DATABASE_URL', f"sqlite:///{os.path.join(workdir, 'bench.db')}")
+    os.environ.setdefault('JOB_INDEX_PATH', os.path.join(workdir, 'job_index.faiss'))
+    os.environ.setdefault('MODEL_WARMUP', 'lazy')
+    import app as application
+    from chat_memory import estimate_tokens
+
+    application.model.latency = args.llm_latency
+    client = application.app.test_client()
+    token = client.post('/api/register', json={
+        'email': 'chat-bench@example.com', 'password': 'bench-password', 'full_name': 'Chat Bench'
+    }).get_json()['token']
+    headers = {'Authorization': f'Bearer {token}'}
+    with application.app.app_context():
+        user_id = application.User.query.filter_by(email='chat-bench@example.com').first().id
+        application.upsert_user_skills([
+            {'user_id': user_id, 'skill_name': name, 'proficiency_level': level}
+            for name, level in [('Python', 4), ('SQL', 3), ('Pandas', 3), ('React.js', 2), ('Git', 4), ('Statistics', 2)]
+        ])
+        application.db.session.commit()
+    client.post('/api/progress/update', json={'course_id': 1, 'progress_percentage': 60}, headers=headers)
+
+    turns, history_tokens = [], 0
+    for turn in range(args.turns):
+        message = QUESTIONS[turn % len(QUESTIONS)]
+        with application.app.app_context():
+            user = application.User.query.get(user_id)
+            start = time.perf_counter()
+            prompt = application.build_chat_prompt(user, message)
+            build_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        response = client.post('/api/chat', json={'message': message}, headers=headers).get_json()['response']
+        request_seconds = time.perf_counter() - start
+
+        # What replaying the full conversation would cost on top of this prompt
+        naive_tokens = estimate_tokens(prompt) + history_tokens
+        history_tokens += estimate_tokens(message) + estimate_tokens(response)
+        turns.append((estimate_tokens(prompt), naive_tokens, build_seconds, request_seconds))
+    application.chat_summaries.drain()
+
+    blocks = []
+    for start in range(0, len(turns), args.block):
+        block = turns[start:start + args.block]
+        blocks.append({
+            'turns': f'{start + 1}-{start + len(block)}',
+            'prompt_tokens': round(statistics.mean(item[0] for item in block), 1),
+            'max_prompt_tokens': max(item[0] for item in block),
+            'full_history_tokens': round(statistics.mean(item[1] for item in block), 1),
+            'build_ms': round(statistics.mean(item[2] for item in block) * 1000, 3),
+            'request_ms': round(statistics.mean(item[3] for item in block) * 1000, 3)
+        })
+
+    print(json.dumps({
+        'benchmark': 'chat_memory',
+        'turns': args.turns,
+        'token_budget': application.app.config['CHAT_TOKEN_BUDGET'],
+        'llm_latency_s': args.llm_latency,
+        'summaries': application.chat_summaries.stats(),
+        'blocks': blocks
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+"""Benchmark the AI course recommendation parser over recorded model outputs.
+
+Measures whole-response parsing, incremental parsing of the same text fed in
+small streamed chunks, and catalog matching against a synthetic catalog.
+
+    python benchmarks/bench_course_parser.py --iterations 2000 --catalog-size 5000
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from course_parser import (  # noqa: E402
+    CatalogCourseMatcher, IncrementalArrayParser, parse_course_recommendations, validate_course
+)
+
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'course_outputs.jsonl')
+
+TOPICS = ['Python', 'React', 'SQL', 'Git', 'Docker', 'Kubernetes', 'Java', 'Go', 'Rust', 'AWS',
+          'Machine Learning', 'Statistics', 'Pandas', 'Node.js', 'TypeScript', 'Security', 'Linux']
+LEVELS = ['Beginner', 'Intermediate', 'Advanced']
+
+
+def load_corpus(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def synthetic_catalog(size, seed=7):
+    rng = random.Random(seed)
+    catalog = []
+    for course_id in range(1, size + 1):
+        topics = rng.sample(TOPICS, 3)
+        catalog.append({
+            'id': course_id,
+            'title': f'{rng.choice(LEVELS)} {topics[0]} for {topics[1]} Developers',
+            'description': f'Hands-on {topics[0]} course',
+            'difficulty': rng.choice(LEVELS),
+            'category': 'Programming',
+            'duration': f'{rng.randint(2, 10)} weeks',
+            'skills_taught': topics
+        })
+    return catalog
+
+
+def timed(fn, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def parse_streamed(text, chunk_size):
+    parser = IncrementalArrayParser()
+    courses = []
+    for start in range(0, len(text), chunk_size):
+        courses.extend(filter(None, map(validate_course, parser.feed(text[start:start + chunk_size]))))
+    return courses
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--iterations', type=int, default=1000)
+    parser.add_argument('--chunk-size', type=int, default=16)
+    parser.add_argument('--catalog-size', type=int, default=5000)
+    parser.add_argument('--corpus', default=CORPUS_PATH)
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus)
+    outputs = []
+    for record in corpus:
+        text = record['text']
+        courses = parse_course_recommendations(text)
+        streamed = parse_streamed(text, args.chunk_size)
+        outputs.append({
+            'name': record['name'],
+            'bytes': len(text),
+            'courses': len(courses),
+            'streamed_matches_full': streamed == courses,
+            'full_us': round(timed(lambda: parse_course_recommendations(text), args.iterations), 2),
+            'streamed_us': round(timed(lambda: parse_streamed(text, args.chunk_size), args.iterations), 2)
+        })
+
+    catalog = synthetic_catalog(args.catalog_size)
+    start = time.perf_counter()
+    matcher = CatalogCourseMatcher(catalog)
+    build_ms = (time.perf_counter() - start) * 1e3
+    recommendations = [course for record in corpus for course in parse_course_recommendations(record['text'])]
+    match_us = timed(lambda: matcher.match(recommendations), max(args.iterations // 10, 1))
+
+    print(json.dumps({
+        'benchmark': 'course_parser',
+        'iterations': args.iterations,
+        'chunk_size': args.chunk_size,
+        'outputs': outputs,
+        'catalog': {
+            'size': args.catalog_size,
+            'build_ms': round(build_ms, 2),
+            'recommendations': len(recommendations),
+            'match_us_per_recommendation': round(match_us / max(len(recommendations), 1), 2)
+        }
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
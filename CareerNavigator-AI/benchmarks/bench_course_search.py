@@ -0,0 +1,104 @@
+"""Benchmark the local course search index (the SQLite search path) on a synthetic catalog.
+
+Measures index build time and per-query latency, including highlighting of
+the returned page, for one- to three-word queries. Also checks that markup in
+course text comes back escaped from both highlighters: the local one and the
+escaping of PostgreSQL ts_headline output.
+
+    python benchmarks/bench_course_search.py --courses 100000 --queries 2000
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from course_search import HEADLINE_SELECTORS, CourseSearchIndex, escape_headline, highlight, terms
+from skill_taxonomy import SKILL_VOCABULARY
+
+TOPICS = ['web', 'data', 'cloud', 'mobile', 'security', 'design', 'analytics', 'backend', 'frontend', 'devops']
+WORDS = (
+    'learn build deploy scale test design analyze visualize model secure automate optimize '
+    'applications services pipelines dashboards projects systems interfaces databases models workflows '
+    'beginner advanced practical hands-on modern production real-world complete introduction guide'
+).split()
+
+
+def synthetic_courses(count, rng):
+    skills = list(SKILL_VOCABULARY)
+    return [
+        {
+            'id': i,
+            'title': f'{rng.choice(skills)} for {rng.choice(TOPICS)} {rng.choice(WORDS)}',
+            'description': ' '.join(rng.choices(WORDS + skills, k=rng.randint(15, 40))),
+            'skills_taught': rng.sample(skills, rng.randint(2, 5)),
+            'category': rng.choice(TOPICS).title(),
+            'difficulty': rng.choice(['Beginner', 'Intermediate', 'Advanced'])
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def highlights_escaped():
+    """Whether course text containing HTML is escaped by both highlighters"""
+    title = 'Python <script>alert(1)</script> & "SQL" <b>basics</b>'
+    start, stop = HEADLINE_SELECTORS
+    # What ts_headline returns for the query "python": hits delimited, text left as is
+    headline = title.replace('Python', f'{start}Python{stop}')
+    snippets = [highlight(title, set(terms('python'))), escape_headline(headline)]
+    return all(
+        snippet.startswith('<mark>Python</mark>') and '<' not in snippet.replace('<mark>', '').replace('</mark>', '')
+        for snippet in snippets
+    ) and snippets[0] == snippets[1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--courses', type=int, default=100000)
+    parser.add_argument('--queries', type=int, default=2000)
+    parser.add_argument('--per-page', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=11)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    courses = synthetic_courses(args.courses, rng)
+    by_id = {course['id']: course for course in courses}
+
+    start = time.perf_counter()
+    index = CourseSearchIndex(courses)
+    build_seconds = time.perf_counter() - start
+
+    vocabulary = list(SKILL_VOCABULARY) + TOPICS + WORDS
+    latencies, totals = [], []
+    for _ in range(args.queries):
+        query = ' '.join(rng.sample(vocabulary, rng.randint(1, 3)))
+        start = time.perf_counter()
+        ranked, total = index.search(query, limit=args.per_page)
+        query_terms = set(terms(query))
+        for course_id, _ in ranked:
+            highlight(by_id[course_id]['title'], query_terms)
+            highlight(by_id[course_id]['description'], query_terms)
+        latencies.append(time.perf_counter() - start)
+        totals.append(total)
+
+    latencies.sort()
+    print(json.dumps({
+        'benchmark': 'course_search',
+        'courses': args.courses,
+        'queries': args.queries,
+        'terms': len(index.postings),
+        'build_s': round(build_seconds, 2),
+        'p50_ms': round(statistics.median(latencies) * 1000, 3),
+        'p95_ms': round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 3),
+        'p99_ms': round(latencies[int(len(latencies) * 0.99) - 1] * 1000, 3),
+        'mean_matches': round(statistics.mean(totals), 1),
+        'highlights_escaped': highlights_escaped()
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""Benchmark embedding throughput: one model call per request vs the micro-batching service.
+
+Each simulated request encodes a single short text, the shape of the
+skill-profile and search-query lookups the app makes per request.
+
+    python benchmarks/bench_embeddings.py --requests 2000 --concurrency 1 8 32
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from embedding_service import EmbeddingService
+
+
+def run(encode, texts, concurrency):
+    latencies = []
+
+    def one(text):
+        start = time.perf_counter()
+        encode([text])
+        latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as executor:
+        list(executor.map(one, texts))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        'requests_per_second': round(len(texts) / elapsed, 1),
+        'p50_ms': round(statistics.median(latencies) * 1000, 3),
+        'p95_ms': round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 3)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--model', default='all-MiniLM-L6-v2')
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 8, 32])
+    parser.add_argument('--max-batch-size', type=int, default=64)
+    parser.add_argument('--max-wait-ms', type=float, default=5)
+    args = parser.parse_args()
+
+    from sentence_transformers import SentenceTransformer
+    model = SentenceTransformer(args.model)
+    model.encode(['warm up'], show_progress_bar=False)
+
+    results = {}
+    for concurrency in args.concurrency:
+        # Distinct texts per run so the service's cache never answers for the model
+        texts = [f'python sql machine learning candidate {concurrency}-{i}' for i in range(args.requests)]
+        service = EmbeddingService(model, max_batch_size=args.max_batch_size, max_wait_ms=args.max_wait_ms)
+        results[concurrency] = {
+            'direct': run(lambda batch: model.encode(batch, show_progress_bar=False), texts, concurrency),
+            'batched': run(service.encode, texts, concurrency),
+            'batch_sizes': service.stats()['batches']
+        }
+
+    print(json.dumps({
+        'benchmark': 'embeddings',
+        'requests': args.requests,
+        'max_batch_size': args.max_batch_size,
+        'max_wait_ms': args.max_wait_ms,
+        'concurrency': results
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
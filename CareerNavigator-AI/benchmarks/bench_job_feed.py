@@ -0,0 +1,104 @@
+"""Benchmark job-feed ingestion throughput and near-duplicate detection.
+
+Generates a synthetic JSON Lines feed in which a share of the rows are reposts
+of earlier postings under a new id with a few words changed, then streams it
+through ingest_job_feed against a throwaway SQLite database. Reports rows per
+second and how many of the planted reposts were caught (recall) versus how
+many distinct postings were wrongly dropped.
+
+    python benchmarks/bench_job_feed.py --rows 50000 --repost-share 0.1 --edits 2
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+TITLES = ['Data Analyst', 'Backend Engineer', 'Frontend Developer', 'ML Engineer', 'DevOps Engineer', 'Product Designer']
+SKILLS = ['Python', 'SQL', 'React.js', 'Docker', 'Kubernetes', 'AWS', 'Pandas', 'TypeScript', 'Figma', 'Git']
+WORDS = (
+    'build maintain scale design own ship improve monitor test deploy services pipelines dashboards models '
+    'platform customers teams product data cloud reliable secure fast modern internal public analytics'
+).split()
+
+
+def posting(rng, index):
+    return {
+        'id': f'job-{index}',
+        'title': rng.choice(TITLES),
+        'company': f'Company {rng.randrange(2000)}',
+        'description': ' '.join(rng.choice(WORDS) for _ in range(60)),
+        'skills': rng.sample(SKILLS, 3),
+        'location': rng.choice(['Remote', 'Berlin', 'Austin', 'Pune'])
+    }
+
+
+def repost(rng, original, index, edits):
+    words = original['description'].split()
+    for _ in range(edits):
+        words[rng.randrange(len(words))] = rng.choice(WORDS)
+    return dict(original, id=f'job-{index}', description=' '.join(words))
+
+
+def write_feed(path, rows, repost_share, edits, seed):
+    rng = random.Random(seed)
+    originals, reposts = [], 0
+    with open(path, 'w', encoding='utf-8') as feed:
+        for index in range(rows):
+            if originals and rng.random() < repost_share:
+                row = repost(rng, rng.choice(originals), index, edits)
+                reposts += 1
+            else:
+                row = posting(rng, index)
+                originals.append(row)
+            feed.write(json.dumps(row) + '\n')
+    return reposts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=20000)
+    parser.add_argument('--repost-share', type=float, default=0.1)
+    parser.add_argument('--edits', type=int, default=2, help='Words changed in each repost')
+    parser.add_argument('--batch-size', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='bench-feed-')
+    os.environ.setdefault('GEMINI_STUB', '1')
+    os.environ.setdefault('DATABASE_URL', f"sqlite:///{os.path.join(workdir, 'bench.db')}")
+    os.environ.setdefault('JOB_INDEX_PATH', os.path.join(workdir, 'job_index.faiss'))
+    os.environ.setdefault('MODEL_WARMUP', 'lazy')
+    import app as application
+
+    feed_path = os.path.join(workdir, 'feed.jsonl')
+    reposts = write_feed(feed_path, args.rows, args.repost_share, args.edits, args.seed)
+    with application.app.app_context():
+        application.create_tables()
+        existing = application.Job.query.count()
+        with open(feed_path, encoding='utf-8') as lines:
+            result = application.ingest_job_feed(lines, 'bench', 'jsonl', batch_size=args.batch_size)
+        stored = application.Job.query.filter_by(source='bench').count()
+
+    originals = args.rows - reposts
+    caught = min(result['duplicates'], reposts)
+    print(json.dumps({
+        'benchmark': 'job_feed',
+        'rows': args.rows,
+        'batch_size': args.batch_size,
+        'repost_edits': args.edits,
+        'seeded_jobs': existing,
+        'planted_reposts': reposts,
+        'duplicates_skipped': result['duplicates'],
+        'repost_recall': round(caught / reposts, 4) if reposts else None,
+        'distinct_postings_dropped': max(originals - stored, 0),
+        'seconds': result['seconds'],
+        'rows_per_second': result['rows_per_second']
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
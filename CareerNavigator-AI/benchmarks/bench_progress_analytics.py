@@ -0,0 +1,156 @@
+"""Benchmark progress-analytics rollups at a million progress events.
+
+Simulates learners moving through courses over a span of weeks, with some
+progress going backwards, and writes the events through
+record_progress_events in batches against a throwaway SQLite database. Then
+times the analytics endpoints, which read the rollups, next to the same
+weekly report aggregated from the raw event log, and checks that the two
+agree.
+
+    python benchmarks/bench_progress_analytics.py --events 1000000 --users 20000 --courses 200
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def simulate(rng, events, users, courses, weeks):
+    """Yield progress events in time order, tracking each pair's furthest progress"""
+    furthest = {}
+    start = datetime.utcnow() - timedelta(weeks=weeks)
+    step = timedelta(weeks=weeks) / events
+    for index in range(events):
+        pair = (rng.randint(1, users), rng.randint(1, courses))
+        previous = furthest.get(pair)
+        if previous is None:
+            progress = float(rng.choice((0, 5, 10)))
+        elif rng.random() < 0.1:
+            progress = max(previous - rng.randint(5, 30), 0.0)
+        else:
+            progress = min(previous + rng.randint(5, 35), 100.0)
+        furthest[pair] = max(previous or 0, progress)
+        yield {
+            'user_id': pair[0],
+            'course_id': pair[1],
+            'progress_percentage': progress,
+            'previous_max': previous,
+            'created_at': start + step * index
+        }
+
+
+def timed(call, repeat):
+    seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call()
+        seconds.append(time.perf_counter() - start)
+    seconds.sort()
+    return {
+        'p50_ms': round(statistics.median(seconds) * 1000, 3),
+        'p99_ms': round(seconds[int(len(seconds) * 0.99) - 1] * 1000, 3)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--events', type=int, default=1000000)
+    parser.add_argument('--users', type=int, default=20000)
+    parser.add_argument('--courses', type=int, default=200)
+    parser.add_argument('--weeks', type=int, default=26)
+    parser.add_argument('--batch-size', type=int, default=5000)
+    parser.add_argument('--reads', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='bench-progress-')
+    os.environ.setdefault('GEMINI_STUB', '1')
+    os.environ.setdefault('DATABASE_URL', f"sqlite:///{os.path.join(workdir, 'bench.db')}")
+    os.environ.setdefault('JOB_INDEX_PATH', os.path.join(workdir, 'job_index.faiss'))
+    os.environ.setdefault('MODEL_WARMUP', 'lazy')
+    import app as application
+    from flask_jwt_extended import create_access_token
+    from sqlalchemy import func, insert
+    from job_feed import batched
+
+    rng = random.Random(args.seed)
+    db = application.db
+    with application.app.app_context():
+        application.create_tables()
+        db.session.execute(insert(application.User), [
+            {'email': f'progress-{i}@example.com', 'password_hash': '-', 'full_name': f'Learner {i}'}
+            for i in range(args.users)
+        ])
+        db.session.commit()
+        first_user = db.session.query(func.min(application.User.id)).scalar()
+
+        batch_seconds = []
+        start = time.perf_counter()
+        for batch in batched(simulate(rng, args.events, args.users, args.courses, args.weeks), args.batch_size):
+            for event in batch:
+                event['user_id'] += first_user - 1
+            batch_start = time.perf_counter()
+            application.record_progress_events(batch)
+            db.session.commit()
+            batch_seconds.append(time.perf_counter() - batch_start)
+        write_seconds = time.perf_counter() - start
+
+        tokens = [create_access_token(identity=first_user + rng.randrange(args.users)) for _ in range(50)]
+        log = application.ProgressEvent
+
+        def weekly_from_log():
+            since = application.week_start(datetime.utcnow()) - timedelta(weeks=11)
+            report = []
+            for week in range(12):
+                week_from = datetime.combine(since + timedelta(weeks=week), datetime.min.time())
+                report.append(db.session.query(
+                    func.count(func.distinct(log.user_id)), func.count(log.id)
+                ).filter(log.created_at >= week_from, log.created_at < week_from + timedelta(weeks=1)).one())
+            return report
+
+        log_seconds = timed(weekly_from_log, max(args.reads // 20, 3))
+        weeks = {row.week_start: (row.active_users, row.events) for row in application.WeeklyTotals.query}
+        since = application.week_start(datetime.utcnow()) - timedelta(weeks=11)
+        consistent = all(
+            weeks.get(since + timedelta(weeks=week), (0, 0)) == tuple(counts)
+            for week, counts in enumerate(weekly_from_log())
+        )
+
+    client = application.app.test_client()
+
+    def get(path):
+        response = client.get(path, headers={'Authorization': f'Bearer {rng.choice(tokens)}'})
+        assert response.status_code == 200, response.get_data(as_text=True)
+
+    reads = {
+        'user_progress': timed(lambda: get('/api/analytics/progress'), args.reads),
+        'course_funnel': timed(lambda: get(f'/api/analytics/courses/{rng.randint(1, args.courses)}/funnel'), args.reads),
+        'weekly_totals': timed(lambda: get('/api/analytics/weekly'), args.reads),
+    }
+
+    batch_seconds.sort()
+    print(json.dumps({
+        'benchmark': 'progress_analytics',
+        'events': args.events,
+        'users': args.users,
+        'courses': args.courses,
+        'batch_size': args.batch_size,
+        'write_seconds': round(write_seconds, 2),
+        'events_per_second': round(args.events / write_seconds, 1),
+        'batch_p50_ms': round(statistics.median(batch_seconds) * 1000, 2),
+        'batch_p99_ms': round(batch_seconds[int(len(batch_seconds) * 0.99) - 1] * 1000, 2),
+        'reads': reads,
+        'weekly_from_event_log': log_seconds,
+        'rollups_match_event_log': consistent
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
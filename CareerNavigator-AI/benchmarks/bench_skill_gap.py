@@ -0,0 +1,74 @@
+"""Benchmark the skill-gap recommender over a synthetic catalog and job board.
+
+Courses and jobs draw skill ids from a Zipf-like distribution so a few skills
+are common and most are rare, as in real postings.
+
+    python benchmarks/bench_skill_gap.py --courses 10000 --jobs 100000 --skills 2000
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from skill_gap import SkillGapRecommender
+
+
+def sample_skills(rng, weights, low, high):
+    return sorted(set(rng.choices(range(1, len(weights) + 1), weights=weights, k=rng.randint(low, high))))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--courses', type=int, default=10000)
+    parser.add_argument('--jobs', type=int, default=100000)
+    parser.add_argument('--skills', type=int, default=2000)
+    parser.add_argument('--queries', type=int, default=20000)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    weights = [1 / rank for rank in range(1, args.skills + 1)]
+    courses = [
+        {'id': i, 'title': f'Course {i}', 'difficulty': rng.choice(['Beginner', 'Intermediate', 'Advanced']),
+         'skill_ids': sample_skills(rng, weights, 2, 6)}
+        for i in range(1, args.courses + 1)
+    ]
+    jobs = [sample_skills(rng, weights, 3, 10) for _ in range(args.jobs)]
+
+    start = time.perf_counter()
+    recommender = SkillGapRecommender(courses)
+    build_seconds = time.perf_counter() - start
+
+    latencies, plan_sizes, uncovered = [], [], 0
+    for _ in range(args.queries):
+        job_skills = rng.choice(jobs)
+        user_skills = sample_skills(rng, weights, 0, 12)
+        start = time.perf_counter()
+        result = recommender.recommend(user_skills, job_skills)
+        latencies.append(time.perf_counter() - start)
+        plan_sizes.append(len(result['plan']))
+        uncovered += bool(result['uncovered'])
+
+    latencies.sort()
+    print(json.dumps({
+        'benchmark': 'skill_gap',
+        'courses': args.courses,
+        'jobs': args.jobs,
+        'skills': args.skills,
+        'queries': args.queries,
+        'build_ms': round(build_seconds * 1000, 1),
+        'p50_ms': round(statistics.median(latencies) * 1000, 4),
+        'p95_ms': round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 4),
+        'p99_ms': round(latencies[int(len(latencies) * 0.99) - 1] * 1000, 4),
+        'mean_courses_per_plan': round(statistics.mean(plan_sizes), 2),
+        'queries_with_uncovered_skills': uncovered
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
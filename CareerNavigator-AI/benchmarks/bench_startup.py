@@ -0,0 +1,83 @@
+"""Benchmark app start-up: import time, first-request latency and time to ready.
+
+Each run happens in a fresh interpreter so nothing is cached between runs.
+A throwaway SQLite database and the fake Gemini model are used unless
+DATABASE_URL / GEMINI_STUB are already set.
+
+    python benchmarks/bench_startup.py --modes lazy background eager --runs 3
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import json, resource, time
+start = time.perf_counter()
+import app as application
+imported = time.perf_counter()
+client = application.app.test_client()
+client.get('/api/health')
+first_request = time.perf_counter()
+ready = None
+while time.perf_counter() - start < {ready_timeout}:
+    if client.get('/api/health').status_code == 200:
+        ready = time.perf_counter()
+        break
+    time.sleep(0.05)
+print(json.dumps({{
+    'import_s': imported - start,
+    'first_request_s': first_request - imported,
+    'ready_s': None if ready is None else ready - start,
+    'max_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    'models': application.models.status()
+}}))
+"""
+
+
+def run_once(mode, ready_timeout):
+    with tempfile.TemporaryDirectory() as workdir:
+        env = dict(os.environ, MODEL_WARMUP=mode)
+        env.setdefault('GEMINI_STUB', '1')
+        env.setdefault('DATABASE_URL', f"sqlite:///{os.path.join(workdir, 'bench.db')}")
+        env.setdefault('JOB_INDEX_PATH', os.path.join(workdir, 'job_index.faiss'))
+        output = subprocess.run(
+            [sys.executable, '-c', PROBE.format(ready_timeout=ready_timeout)],
+            cwd=APP_DIR, env=env, capture_output=True, text=True, check=True
+        ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def summarize(samples, key):
+    values = [sample[key] for sample in samples if sample[key] is not None]
+    if not values:
+        return None
+    return {'median': round(statistics.median(values), 4), 'min': round(min(values), 4), 'max': round(max(values), 4)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--modes', nargs='+', default=['lazy', 'background', 'eager'])
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--ready-timeout', type=float, default=120)
+    args = parser.parse_args()
+
+    results = {}
+    for mode in args.modes:
+        samples = [run_once(mode, args.ready_timeout) for _ in range(args.runs)]
+        results[mode] = {
+            key: summarize(samples, key)
+            for key in ('import_s', 'first_request_s', 'ready_s', 'max_rss_mb')
+        }
+        results[mode]['models'] = samples[-1]['models']
+
+    print(json.dumps({'benchmark': 'startup', 'runs': args.runs, 'modes': results}, indent=2))
+
+
+if __name__ == '__main__':
+    main()
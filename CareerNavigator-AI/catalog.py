@@ -0,0 +1,93 @@
+import json
+import threading
+import time
+
+
+def serialize_course(course):
+    return {
+        'id': course.id,
+        'title': course.title,
+        'description': course.description,
+        'difficulty': course.difficulty,
+        'category': course.category,
+        'duration': course.duration,
+        'skills_taught': json.loads(course.skills_taught) if course.skills_taught else [],
+        'skill_ids': json.loads(course.skill_ids) if course.skill_ids else []
+    }
+
+
+class CourseCatalog:
+    """Process-level cache of pre-decoded course dicts.
+
+    The catalog is loaded with a single query the first time it is needed and
+    kept until ``invalidate`` is called, which the app does whenever a
+    ``Course`` row is written. ``max_age`` bounds how long a copy may live so
+    that writes made by other worker processes are eventually picked up.
+    Reads never touch the database.
+    """
+
+    def __init__(self, loader, max_age=300):
+        self._loader = loader
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._courses = None
+        self._by_id = {}
+        self._derived = {}
+        self._loaded_at = 0.0
+        self.hits = 0
+        self.misses = 0
+
+    def invalidate(self):
+        with self._lock:
+            self._courses = None
+            self._by_id = {}
+            self._derived = {}
+
+    def _cached(self):
+        courses = self._courses
+        if courses is not None and time.monotonic() - self._loaded_at < self.max_age:
+            return courses
+        return None
+
+    def all(self):
+        courses = self._cached()
+        if courses is not None:
+            self.hits += 1
+            return courses
+        with self._lock:
+            if self._cached() is None:
+                self.misses += 1
+                courses = [serialize_course(course) for course in self._loader()]
+                self._by_id = {course['id']: course for course in courses}
+                self._derived = {}
+                self._courses = courses
+                self._loaded_at = time.monotonic()
+            return self._courses
+
+    def derived(self, name, build):
+        """Return a structure built from the catalog, rebuilt whenever the catalog reloads"""
+        courses = self.all()
+        derived = self._derived
+        if name not in derived:
+            derived[name] = build(courses)
+        return derived[name]
+
+    def get(self, course_id):
+        self.all()
+        return self._by_id.get(course_id)
+
+    def filter(self, category=None, difficulty=None):
+        courses = self.all()
+        if category:
+            category = category.lower()
+            courses = [c for c in courses if (c['category'] or '').lower() == category]
+        if difficulty:
+            difficulty = difficulty.lower()
+            courses = [c for c in courses if (c['difficulty'] or '').lower() == difficulty]
+        return courses
+
+    def page(self, page=1, per_page=20, category=None, difficulty=None):
+        """Return ``(courses, total)`` for one page of the filtered catalog"""
+        courses = self.filter(category=category, difficulty=difficulty)
+        start = (page - 1) * per_page
+        return courses[start:start + per_page], len(courses)
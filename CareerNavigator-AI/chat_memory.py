@@ -0,0 +1,141 @@
+import logging
+import threading
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+# Rough size of a token in characters for English text; close enough to budget
+# prompts without shipping the model's tokenizer
+CHARS_PER_TOKEN = 4
+
+ROLE_LABELS = {'user': 'User', 'assistant': 'Assistant'}
+
+
+def estimate_tokens(text):
+    return (len(text or '') + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def truncate_to_tokens(text, tokens):
+    """``text`` cut at a word boundary to about ``tokens`` tokens"""
+    limit = tokens * CHARS_PER_TOKEN
+    if len(text) <= limit:
+        return text
+    cut = text.rfind(' ', 0, limit)
+    return text[:cut if cut > 0 else limit].rstrip() + ' …'
+
+
+def format_turn(role, content):
+    return f"{ROLE_LABELS.get(role, role)}: {content}"
+
+
+def assemble_prompt(instructions, context, summary, recent, user_message, budget, summary_tokens=300):
+    """Build a chat prompt that fits in ``budget`` tokens
+
+    Instructions, user context and the new message are always included. The
+    conversation summary takes up to ``summary_tokens``, and whatever budget
+    is left goes to ``recent`` turns (``(role, content)`` pairs, oldest
+    first), newest first, so the oldest turns are the ones dropped. Returns
+    ``(prompt, turns_included)``.
+    """
+    head = [instructions.strip()]
+    if context:
+        head.append('What we know about the user:\n' + '\n'.join(f'- {line}' for line in context))
+    tail = [f'User message: {user_message}']
+    used = sum(estimate_tokens(part) for part in head + tail)
+
+    if summary:
+        summary = truncate_to_tokens(summary, min(summary_tokens, max(budget - used, 0)))
+        summary_part = f'Summary of the earlier conversation:\n{summary}'
+        head.append(summary_part)
+        used += estimate_tokens(summary_part)
+
+    turns = []
+    for role, content in reversed(recent):
+        line = format_turn(role, content)
+        cost = estimate_tokens(line) + 1
+        if used + cost > budget:
+            break
+        turns.append(line)
+        used += cost
+    if turns:
+        head.append('Recent conversation:\n' + '\n'.join(reversed(turns)))
+    return '\n\n'.join(head + tail), len(turns)
+
+
+def summary_prompt(previous, messages, max_tokens, message_tokens=200):
+    """Prompt asking the model to fold ``messages`` into the running summary"""
+    transcript = '\n'.join(format_turn(role, truncate_to_tokens(content, message_tokens)) for role, content in messages)
+    return f"""
+        You maintain a running summary of a career coaching conversation.
+        Update the summary with the new exchanges below. Keep facts about the
+        user's goals, skills, constraints, decisions and open questions; drop
+        pleasantries. Answer with the summary only, in at most {max_tokens * 3 // 4} words.
+
+        Current summary:
+        {previous or '(none yet)'}
+
+        New exchanges:
+        {transcript}
+        """
+
+
+class SummaryQueue:
+    """Runs ``summarize(key)`` for queued keys on a background thread.
+
+    A key queued again before its turn comes up is summarized once, so a
+    burst of chat turns costs a single model call. A failed run is counted
+    and dropped; the key is queued again by the next turn that needs it. The
+    thread starts on first use and again after a fork.
+    """
+
+    def __init__(self, summarize):
+        self._summarize = summarize
+        self._pending = OrderedDict()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._worker = None
+        self.runs = 0
+        self.failures = 0
+
+    def add(self, key):
+        self._ensure_worker()
+        with self._lock:
+            self._pending[key] = True
+        self._wakeup.set()
+
+    def _ensure_worker(self):
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name='chat-summaries', daemon=True)
+                self._worker.start()
+
+    def _next(self):
+        with self._lock:
+            if not self._pending:
+                return None
+            key, _ = self._pending.popitem(last=False)
+            return key
+
+    def _run(self):
+        while True:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            self.drain()
+
+    def drain(self):
+        """Summarize everything queued so far in the calling thread"""
+        while True:
+            key = self._next()
+            if key is None:
+                return
+            try:
+                self._summarize(key)
+                self.runs += 1
+            except Exception:
+                self.failures += 1
+                logger.exception('Conversation summary for %s failed', key)
+
+    def stats(self):
+        return {'pending': len(self._pending), 'runs': self.runs, 'failures': self.failures}
@@ -0,0 +1,292 @@
+import json
+import re
+from collections import defaultdict
+
+from matching import skill_tokens
+
+# Characters that change the scanner's state outside and inside JSON strings.
+# Models sometimes quote keys and values with curly quotes. A string ends at a
+# quote of the kind that opened it, or at one of the other kind that is
+# clearly closing it (followed by ``:``, ``,``, ``}`` or ``]``).
+_STRUCTURE_RE = re.compile(r'[\[\]{}"“”]')
+_STRING_RE = re.compile(r'["\\“”]')
+_CLOSING_RE = re.compile(r'\s*[:,}\]]')
+_TRAILING_COMMA_RE = re.compile(r',\s*([}\]])')
+_SMART_SINGLE_QUOTES = str.maketrans({'‘': "'", '’': "'"})
+_CURLY_QUOTES = '“”'
+
+DIFFICULTY_ALIASES = {
+    'beginner': 'Beginner', 'basic': 'Beginner', 'easy': 'Beginner', 'introductory': 'Beginner',
+    'intermediate': 'Intermediate', 'medium': 'Intermediate',
+    'advanced': 'Advanced', 'hard': 'Advanced', 'expert': 'Advanced'
+}
+
+# field -> (accepted types, required, alternative keys models tend to use)
+COURSE_SCHEMA = {
+    'title': (str, True, ('name', 'course_title')),
+    'description': (str, False, ('summary',)),
+    'difficulty': (str, False, ('level', 'difficulty_level')),
+    'duration': ((str, int, float), False, ('estimated_duration',)),
+    'skills': ((list, str), False, ('key_skills', 'skills_taught', 'skills_learned'))
+}
+
+TITLE_STOPWORDS = {
+    'a', 'an', 'and', 'the', 'to', 'of', 'for', 'in', 'on', 'with', 'from', 'your',
+    'course', 'introduction', 'intro', 'basics', 'beginners', 'scratch', 'mastering'
+}
+
+
+class IncrementalArrayParser:
+    """Pull complete objects out of the first JSON array in a model response.
+
+    Text can be fed in arbitrary chunks as it streams in; each call to
+    ``feed`` returns the objects completed by that chunk. The scanner only
+    stops at structural characters, so it tolerates markdown fences and prose
+    around the array. A truncated trailing object is simply never emitted.
+    """
+
+    def __init__(self):
+        self.buffer = ''
+        self.position = 0
+        self.depth = 0
+        self.in_string = False
+        self.curly_string = False
+        self.started = False
+        self.object_start = None
+        self.errors = 0
+
+    def feed(self, text):
+        self.buffer += text
+        objects = []
+        buffer = self.buffer
+        position = self.position
+        while True:
+            if self.in_string:
+                match = _STRING_RE.search(buffer, position)
+                if not match:
+                    position = len(buffer)
+                    break
+                if match.group() == '\\':
+                    if match.end() >= len(buffer):
+                        # Escape split across chunks; wait for more input
+                        position = match.start()
+                        break
+                    position = match.end() + 1
+                    continue
+                if (match.group() == '"') != self.curly_string:
+                    self.in_string = self.curly_string = False
+                elif not buffer[match.end():].strip():
+                    # Whether a mismatched quote closes depends on what follows; wait for it
+                    position = match.start()
+                    break
+                elif _CLOSING_RE.match(buffer, match.end()):
+                    self.in_string = self.curly_string = False
+                position = match.end()
+                continue
+
+            match = _STRUCTURE_RE.search(buffer, position)
+            if not match:
+                position = len(buffer)
+                break
+            char, position = match.group(), match.end()
+
+            if not self.started:
+                if char == '[':
+                    self.started = True
+                    self.depth = 1
+                elif char == '{':
+                    # A bare object with no array around it
+                    self.started = True
+                    self.depth = 1
+                    self.object_start = match.start()
+                    self.depth += 1
+                continue
+
+            if char == '"':
+                self.in_string = True
+            elif char in _CURLY_QUOTES:
+                self.in_string = self.curly_string = True
+            elif char in '[{':
+                if self.depth == 1 and char == '{':
+                    self.object_start = match.start()
+                self.depth += 1
+            else:
+                self.depth -= 1
+                if self.depth == 1 and self.object_start is not None:
+                    parsed = loads_lenient(buffer[self.object_start:position])
+                    if parsed is None:
+                        self.errors += 1
+                    else:
+                        objects.append(parsed)
+                    self.object_start = None
+                elif self.depth <= 0:
+                    self.started = False
+                    self.depth = 0
+
+        # Drop consumed text so the buffer only holds the object in progress
+        keep_from = self.object_start if self.object_start is not None else position
+        self.buffer = buffer[keep_from:]
+        self.position = position - keep_from
+        if self.object_start is not None:
+            self.object_start = 0
+        return objects
+
+
+def loads_lenient(text):
+    """``json.loads`` with repairs for the usual LLM mistakes; returns None if hopeless"""
+    try:
+        return json.loads(text)
+    except ValueError:
+        pass
+    repaired = _TRAILING_COMMA_RE.sub(r'\1', repair_curly_quotes(text))
+    if '"' not in repaired:
+        repaired = repaired.translate(_SMART_SINGLE_QUOTES).replace("'", '"')
+    repaired = re.sub(r'\bTrue\b', 'true', repaired)
+    repaired = re.sub(r'\bFalse\b', 'false', repaired)
+    repaired = re.sub(r'\bNone\b', 'null', repaired)
+    try:
+        return json.loads(repaired)
+    except ValueError:
+        return None
+
+
+def repair_curly_quotes(text):
+    """Turn curly quotes used as JSON string delimiters into straight ones
+
+    Curly quotes inside properly quoted strings are content and stay as they
+    are, unless one is clearly closing the string (followed by ``:``, ``,``,
+    ``}`` or ``]``), as in ``"title”: ...``. Straight quotes inside a
+    curly-quoted string are escaped unless they close it the same way.
+    """
+    if not any(quote in text for quote in _CURLY_QUOTES):
+        return text
+    out = []
+    state = None  # None outside strings, '"' in a straight string, '“' in a curly one
+    escaped = False
+    for position, char in enumerate(text):
+        if escaped:
+            out.append(char)
+            escaped = False
+        elif state is None:
+            if char == '"' or char in _CURLY_QUOTES:
+                out.append('"')
+                state = '"' if char == '"' else '“'
+            else:
+                out.append(char)
+        elif char == '\\':
+            out.append(char)
+            escaped = True
+        elif char == '"' or char in _CURLY_QUOTES:
+            closes = (char == '"') == (state == '"') or _CLOSING_RE.match(text, position + 1)
+            if closes:
+                out.append('"')
+                state = None
+            else:
+                out.append('\\"' if char == '"' else char)
+        else:
+            out.append(char)
+    return ''.join(out)
+
+
+def validate_course(item):
+    """Coerce one parsed item to the course schema, or return None if it is unusable"""
+    if not isinstance(item, dict):
+        return None
+    item = {str(key).strip().lower().replace(' ', '_'): value for key, value in item.items()}
+    course = {}
+    for field, (types, required, aliases) in COURSE_SCHEMA.items():
+        value = next((item[key] for key in (field,) + aliases if key in item), None)
+        if value is None or not isinstance(value, types):
+            if required:
+                return None
+            continue
+        course[field] = value
+
+    course['title'] = course['title'].strip()[:200]
+    if not course['title']:
+        return None
+    if 'difficulty' in course:
+        course['difficulty'] = DIFFICULTY_ALIASES.get(course['difficulty'].strip().lower())
+    if isinstance(course.get('duration'), (int, float)):
+        course['duration'] = f"{course['duration']:g} weeks"
+    skills = course.get('skills', [])
+    if isinstance(skills, str):
+        skills = skills.split(',')
+    course['skills'] = [str(skill).strip() for skill in skills if str(skill).strip()]
+    return course
+
+
+def parse_course_recommendations(text):
+    """Extract and validate every course in a complete model response"""
+    parser = IncrementalArrayParser()
+    courses = (validate_course(item) for item in parser.feed(text))
+    return [course for course in courses if course]
+
+
+def title_tokens(title):
+    return {token for token in skill_tokens(title) if token not in TITLE_STOPWORDS}
+
+
+class CatalogCourseMatcher:
+    """Nearest-neighbour lookup of recommended courses against the real catalog.
+
+    Each catalog course is indexed by its title and skill tokens. A
+    recommendation is scored only against courses sharing at least one token,
+    using Jaccard similarity on titles and overlap on skills.
+    """
+
+    def __init__(self, courses, min_score=0.2, title_weight=0.6):
+        self.courses = courses
+        self.min_score = min_score
+        self.title_weight = title_weight
+        self._title_tokens = []
+        self._skill_tokens = []
+        self._postings = defaultdict(set)
+        for position, course in enumerate(courses):
+            titles = title_tokens(course['title'])
+            skills = {token for skill in course['skills_taught'] for token in skill_tokens(skill)}
+            self._title_tokens.append(titles)
+            self._skill_tokens.append(skills)
+            for token in titles | skills:
+                self._postings[token].add(position)
+
+    def nearest(self, recommendation):
+        """Return ``(catalog_course, score)`` for the best match, or ``(None, 0)``"""
+        titles = title_tokens(recommendation['title'])
+        skills = {token for skill in recommendation['skills'] for token in skill_tokens(skill)}
+        candidates = set()
+        for token in titles | skills:
+            candidates |= self._postings.get(token, set())
+
+        best, best_score = None, 0.0
+        for position in candidates:
+            course_titles, course_skills = self._title_tokens[position], self._skill_tokens[position]
+            title_score = len(titles & course_titles) / len(titles | course_titles) if titles else 0.0
+            skill_score = len(skills & course_skills) / len(skills) if skills else 0.0
+            score = self.title_weight * title_score + (1 - self.title_weight) * skill_score
+            if score > best_score:
+                best, best_score = self.courses[position], score
+        if best_score < self.min_score:
+            return None, 0.0
+        return best, best_score
+
+    def match(self, recommendations):
+        """Map recommendations onto distinct catalog courses, keeping the model's order"""
+        matched, seen = [], set()
+        for recommendation in recommendations:
+            course, score = self.nearest(recommendation)
+            if course is None or course['id'] in seen:
+                continue
+            seen.add(course['id'])
+            matched.append({
+                'id': course['id'],
+                'title': course['title'],
+                'description': course['description'],
+                'difficulty': course['difficulty'],
+                'category': course['category'],
+                'duration': course['duration'],
+                'skills': course['skills_taught'],
+                'recommended_as': recommendation['title'],
+                'match_score': round(score * 100, 1)
+            })
+        return matched
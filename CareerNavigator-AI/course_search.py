@@ -0,0 +1,167 @@
+import html
+import re
+from functools import lru_cache
+
+import numpy as np
+
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+
+STOPWORDS = frozenset(
+    'a an and are as at be by for from how in into is it of on or that the this to with your you'.split()
+)
+
+# Field weights: a hit in the title counts double, one in the skills half again
+FIELD_WEIGHTS = {'title': 2.0, 'skills': 1.5, 'description': 1.0}
+
+# Hit delimiters asked of ts_headline; swapped for markup only after escaping
+HEADLINE_SELECTORS = ('\x02', '\x03')
+
+
+def stem(token):
+    """Light suffix stripping ("courses" -> "course", "learning" -> "learn")"""
+    if len(token) > 4 and token.endswith('ies'):
+        return token[:-3] + 'y'
+    for suffix in ('ing', 'ed'):
+        if len(token) > len(suffix) + 3 and token.endswith(suffix):
+            return token[:-len(suffix)]
+    if len(token) > 3 and token.endswith('s') and not token.endswith(('ss', 'us', 'is')):
+        return token[:-1]
+    return token
+
+
+@lru_cache(maxsize=100000)
+def _token_terms(token):
+    if token in STOPWORDS:
+        return ()
+    if '.' in token:
+        return (token,) + tuple(part for part in token.split('.') if part not in STOPWORDS)
+    if token.isalpha():
+        return (stem(token),)
+    return (token,)
+
+
+def terms(text):
+    """Stemmed search terms of ``text``, stopwords removed
+
+    Dotted names are kept whole and also split, so "react" finds "React.js".
+    """
+    return [term for token in TOKEN_RE.findall((text or '').lower()) for term in _token_terms(token)]
+
+
+def course_fields(course):
+    return {
+        'title': course.get('title') or '',
+        'description': course.get('description') or '',
+        'skills': ', '.join(course.get('skills_taught') or [])
+    }
+
+
+def highlight(text, query_terms, max_words=30, marker=('<mark>', '</mark>')):
+    """Escaped snippet of ``text`` around the first query hit, with hits wrapped in ``marker``"""
+    words = (text or '').split()
+    if not words:
+        return ''
+    hits = [i for i, word in enumerate(words) if any(term in query_terms for term in terms(word))]
+    start = max(0, min(hits[0] - max_words // 3, len(words) - max_words)) if hits else 0
+    window = words[start:start + max_words]
+    hit_set = {i - start for i in hits}
+    snippet = ' '.join(
+        f'{marker[0]}{html.escape(word)}{marker[1]}' if i in hit_set else html.escape(word)
+        for i, word in enumerate(window)
+    )
+    if start > 0:
+        snippet = '… ' + snippet
+    if start + max_words < len(words):
+        snippet += ' …'
+    return snippet
+
+
+def escape_headline(text, marker=('<mark>', '</mark>')):
+    """Escape a ts_headline snippet delimited by HEADLINE_SELECTORS, wrapping hits in ``marker``"""
+    start, stop = HEADLINE_SELECTORS
+    return html.escape(text or '').replace(start, marker[0]).replace(stop, marker[1])
+
+
+class CourseSearchIndex:
+    """BM25 inverted index over the course catalog, for databases without full-text search.
+
+    Postings hold precomputed BM25 weights per (term, course), so a query is a
+    handful of vectorized adds into a score array followed by a partial sort.
+    All query terms must match, like ``plainto_tsquery`` on PostgreSQL.
+    """
+
+    def __init__(self, courses, k1=1.2, b=0.75):
+        self.course_ids = np.array([course['id'] for course in courses], dtype=np.int64)
+        self.categories = np.array([(course.get('category') or '').lower() for course in courses], dtype=object)
+        self.difficulties = np.array([(course.get('difficulty') or '').lower() for course in courses], dtype=object)
+
+        docs_by_term, tfs_by_term, lengths = {}, {}, []
+        for doc, course in enumerate(courses):
+            counts, length = {}, 0
+            for field, text in course_fields(course).items():
+                weight = FIELD_WEIGHTS[field]
+                field_terms = terms(text)
+                length += len(field_terms)
+                for term in field_terms:
+                    counts[term] = counts.get(term, 0.0) + weight
+            lengths.append(length)
+            for term, tf in counts.items():
+                if term in docs_by_term:
+                    docs_by_term[term].append(doc)
+                    tfs_by_term[term].append(tf)
+                else:
+                    docs_by_term[term] = [doc]
+                    tfs_by_term[term] = [tf]
+        lengths = np.array(lengths, dtype=np.float32)
+
+        average = lengths.mean() if len(courses) else 1.0
+        norms = k1 * (1 - b + b * lengths / max(average, 1e-9))
+        self.postings = {}
+        for term, docs in docs_by_term.items():
+            docs = np.array(docs, dtype=np.int32)
+            tfs = np.array(tfs_by_term[term], dtype=np.float32)
+            idf = np.log(1 + (len(courses) - len(docs) + 0.5) / (len(docs) + 0.5))
+            self.postings[term] = (docs, (idf * tfs * (k1 + 1) / (tfs + norms[docs])).astype(np.float32))
+
+    def __len__(self):
+        return len(self.course_ids)
+
+    def search(self, query, limit=20, category=None, difficulty=None):
+        """Return ``(ranked, total)``: the best ``limit`` ``(course_id, score)`` pairs and the match count"""
+        query_terms = list(dict.fromkeys(terms(query)))
+        if not query_terms or any(term not in self.postings for term in query_terms):
+            return [], 0
+        scores = np.zeros(len(self.course_ids), dtype=np.float32)
+        matched = np.zeros(len(self.course_ids), dtype=np.int8)
+        for term in query_terms:
+            docs, weights = self.postings[term]
+            scores[docs] += weights
+            matched[docs] += 1
+        mask = matched == len(query_terms)
+        if category:
+            mask &= self.categories == category.lower()
+        if difficulty:
+            mask &= self.difficulties == difficulty.lower()
+
+        candidates = np.flatnonzero(mask)
+        total = len(candidates)
+        if total > limit:
+            candidates = candidates[np.argpartition(-scores[candidates], limit - 1)[:limit]]
+        candidates = candidates[np.argsort(-scores[candidates], kind='stable')]
+        return [(int(self.course_ids[doc]), float(scores[doc])) for doc in candidates], total
+
+
+def rerank(ranked, query_vector, course_vectors, alpha=0.5):
+    """Blend normalized lexical scores with cosine similarity to the query embedding
+
+    ``course_vectors`` is aligned with ``ranked``; ``alpha`` weights the lexical score.
+    """
+    if not ranked:
+        return ranked
+    lexical = np.array([score for _, score in ranked], dtype=np.float32)
+    top = lexical.max()
+    if top > 0:
+        lexical /= top
+    blended = alpha * lexical + (1 - alpha) * (course_vectors @ query_vector)
+    order = np.argsort(-blended, kind='stable')
+    return [(ranked[i][0], float(blended[i])) for i in order]
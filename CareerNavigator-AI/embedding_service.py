@@ -0,0 +1,170 @@
+import hashlib
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+import numpy as np
+
+# Upper bounds of the batch-size buckets reported in the metrics
+BATCH_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+
+def text_key(text):
+    return hashlib.sha1(text.encode('utf-8')).digest()
+
+
+class _Request:
+    __slots__ = ('texts', 'future', 'enqueued_at')
+
+    def __init__(self, texts):
+        self.texts = texts
+        self.future = Future()
+        self.enqueued_at = time.perf_counter()
+
+
+class EmbeddingService:
+    """In-process embedding worker that micro-batches concurrent encode calls.
+
+    Callers block on ``encode`` while a single worker thread drains the queue:
+    it waits at most ``max_wait_ms`` after the first pending request for
+    others to arrive, then encodes up to ``max_batch_size`` distinct texts in
+    one model call. Results are cached by text hash in a bounded LRU. The
+    service mimics ``SentenceTransformer.encode`` closely enough to be passed
+    anywhere a model is expected; vectors are always L2-normalized.
+
+    The worker thread starts on first use, and again in a forked process
+    (threads do not survive ``fork``), so it is safe to create before
+    gunicorn forks its workers.
+    """
+
+    def __init__(self, model, max_batch_size=64, max_wait_ms=5, cache_size=20000, timeout=30.0):
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.cache_size = cache_size
+        self.timeout = timeout
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._metrics_lock = threading.Lock()
+        self._batches = {bucket: {'batches': 0, 'texts': 0, 'encode_seconds': 0.0, 'wait_seconds': 0.0}
+                         for bucket in BATCH_BUCKETS + ('more',)}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._worker = None
+        self._worker_lock = threading.Lock()
+
+    def get_sentence_embedding_dimension(self):
+        return self.model.get_sentence_embedding_dimension()
+
+    def encode(self, texts, **kwargs):
+        """Return a ``len(texts) x dim`` float32 array (a single vector for a str)"""
+        single = isinstance(texts, str)
+        texts = [texts] if single else list(texts)
+        keys = [text_key(text) for text in texts]
+        vectors = [None] * len(texts)
+        missing = {}
+        with self._cache_lock:
+            for i, key in enumerate(keys):
+                vector = self._cache.get(key)
+                if vector is None:
+                    missing.setdefault(texts[i], []).append(i)
+                else:
+                    self._cache.move_to_end(key)
+                    vectors[i] = vector
+            self.cache_hits += len(texts) - sum(len(positions) for positions in missing.values())
+            self.cache_misses += len(missing)
+
+        if missing:
+            self._ensure_worker()
+            request = _Request(list(missing))
+            self._queue.put(request)
+            for text, vector in zip(request.texts, request.future.result(timeout=self.timeout)):
+                for i in missing[text]:
+                    vectors[i] = vector
+
+        if not vectors:
+            return np.zeros((0, self.get_sentence_embedding_dimension()), dtype='float32')
+        result = np.vstack(vectors).astype('float32', copy=False)
+        return result[0] if single else result
+
+    def _ensure_worker(self):
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name='embedding-service', daemon=True)
+                self._worker.start()
+
+    def _collect(self):
+        first = self._queue.get()
+        batch, size = [first], len(first.texts)
+        deadline = first.enqueued_at + self.max_wait
+        while size < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                request = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            batch.append(request)
+            size += len(request.texts)
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            texts = list(dict.fromkeys(text for request in batch for text in request.texts))
+            started = time.perf_counter()
+            try:
+                vectors = np.asarray(self.model.encode(
+                    texts, batch_size=self.max_batch_size, normalize_embeddings=True, show_progress_bar=False
+                ), dtype='float32')
+            except Exception as e:
+                for request in batch:
+                    request.future.set_exception(e)
+                continue
+            encode_seconds = time.perf_counter() - started
+
+            by_text = dict(zip(texts, vectors))
+            with self._cache_lock:
+                for text, vector in by_text.items():
+                    self._cache[text_key(text)] = vector
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+            for request in batch:
+                request.future.set_result([by_text[text] for text in request.texts])
+            self._record(len(texts), encode_seconds, sum(started - request.enqueued_at for request in batch) / len(batch))
+
+    def _record(self, size, encode_seconds, wait_seconds):
+        bucket = next((bucket for bucket in BATCH_BUCKETS if size <= bucket), 'more')
+        with self._metrics_lock:
+            stats = self._batches[bucket]
+            stats['batches'] += 1
+            stats['texts'] += size
+            stats['encode_seconds'] += encode_seconds
+            stats['wait_seconds'] += wait_seconds
+
+    def stats(self):
+        with self._metrics_lock:
+            batches = {}
+            for bucket, stats in self._batches.items():
+                if not stats['batches']:
+                    continue
+                batches[f'<={bucket}' if bucket != 'more' else f'>{BATCH_BUCKETS[-1]}'] = {
+                    'batches': stats['batches'],
+                    'texts': stats['texts'],
+                    'mean_encode_ms': round(stats['encode_seconds'] / stats['batches'] * 1000, 3),
+                    'mean_queue_wait_ms': round(stats['wait_seconds'] / stats['batches'] * 1000, 3),
+                    'texts_per_second': round(stats['texts'] / stats['encode_seconds'], 1) if stats['encode_seconds'] else None
+                }
+        return {
+            'cache_entries': len(self._cache),
+            'cache_hits': self.cache_hits,
+            'cache_misses': self.cache_misses,
+            'pending_requests': self._queue.qsize(),
+            'batches': batches
+        }
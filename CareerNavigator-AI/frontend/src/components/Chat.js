@@ -1,5 +1,5 @@
 import React, { useState, useEffect, useRef } from 'react';
-import { api } from '../services/api';
+import { streamChat } from '../services/api';
 
 const Chat = () => {
   const [messages, setMessages] = useState([
@@ -13,6 +13,7 @@ const Chat = () => {
   const [inputMessage, setInputMessage] = useState('');
   const [isTyping, setIsTyping] = useState(false);
   const messagesEndRef = useRef(null);
+  const abortRef = useRef(null);
 
   const scrollToBottom = () => {
     messagesEndRef.current?.scrollIntoView({ behavior: 'smooth' });
@@ -22,6 +23,9 @@ const Chat = () => {
     scrollToBottom();
   }, [messages]);
 
+  // Cancel any in-flight stream when leaving the page
+  useEffect(() => () => abortRef.current?.abort(), []);
+
   const sendMessage = async () => {
     if (!inputMessage.trim()) return;
 
@@ -36,27 +40,36 @@ const Chat = () => {
     setInputMessage('');
     setIsTyping(true);
 
-    try {
-      const response = await api.post('/chat', { message: inputMessage });
-      
-      const botMessage = {
-        id: messages.length + 2,
-        type: 'bot',
-        content: response.data.response,
-        timestamp: new Date()
-      };
+    const botMessageId = messages.length + 2;
+    const controller = new AbortController();
+    abortRef.current = controller;
 
-      setMessages(prev => [...prev, botMessage]);
+    try {
+      await streamChat(inputMessage, {
+        signal: controller.signal,
+        onToken: (text) => {
+          setIsTyping(false);
+          setMessages(prev => {
+            const existing = prev.find(m => m.id === botMessageId);
+            if (existing) {
+              return prev.map(m => m.id === botMessageId ? { ...m, content: m.content + text } : m);
+            }
+            return [...prev, { id: botMessageId, type: 'bot', content: text, timestamp: new Date() }];
+          });
+        }
+      });
     } catch (error) {
+      if (error.name === 'AbortError') return;
       const errorMessage = {
-        id: messages.length + 2,
+        id: botMessageId,
         type: 'bot',
         content: 'I apologize, but I encountered an error. Please try again later.',
         timestamp: new Date()
       };
-      setMessages(prev => [...prev, errorMessage]);
+      setMessages(prev => [...prev.filter(m => m.id !== botMessageId), errorMessage]);
     } finally {
       setIsTyping(false);
+      abortRef.current = null;
     }
   };
 
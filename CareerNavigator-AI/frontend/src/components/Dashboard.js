@@ -3,6 +3,44 @@ import { Link } from 'react-router-dom';
 import { useAuth } from '../context/AuthContext';
 import { api } from '../services/api';
 
+// Sections from earlier dashboard responses, kept across visits. Their ETags
+// are sent back so the API only returns the sections that changed.
+let dashboardCache = { userId: null, etag: null, sections: {} };
+
+const cachedSections = () => Object.fromEntries(
+  Object.entries(dashboardCache.sections).map(([name, { data }]) => [name, { status: 'ok', data }])
+);
+
+const fetchDashboardSections = async (userId) => {
+  if (dashboardCache.userId !== userId) {
+    dashboardCache = { userId, etag: null, sections: {} };
+  }
+  const headers = {};
+  const known = Object.entries(dashboardCache.sections).map(([name, { etag }]) => `${name}=${etag}`);
+  if (known.length) headers['X-Section-ETags'] = known.join(',');
+  if (dashboardCache.etag) headers['If-None-Match'] = dashboardCache.etag;
+
+  const response = await api.get('/dashboard', {
+    headers,
+    validateStatus: (status) => (status >= 200 && status < 300) || status === 304,
+  });
+  if (response.status === 304) return cachedSections();
+
+  const sections = {};
+  for (const [name, section] of Object.entries(response.data.sections)) {
+    if (section.status === 'ok') {
+      dashboardCache.sections[name] = { etag: section.etag, data: section.data };
+      sections[name] = section;
+    } else if (section.status === 'not_modified' && dashboardCache.sections[name]) {
+      sections[name] = { status: 'ok', data: dashboardCache.sections[name].data };
+    } else {
+      sections[name] = section;
+    }
+  }
+  dashboardCache.etag = response.headers.etag || null;
+  return sections;
+};
+
 const Dashboard = () => {
   const { user } = useAuth();
   const [stats, setStats] = useState({
@@ -22,28 +60,34 @@ const Dashboard = () => {
 
   const fetchDashboardData = async () => {
     try {
-      const [profileRes, coursesRes, jobsRes, leaderboardRes] = await Promise.all([
-        api.get('/user/profile'),
-        api.get('/courses'),
-        api.get('/jobs/recommendations'),
-        api.get('/leaderboard')
+      const sections = await fetchDashboardSections(user?.id);
+
+      // Sections that were still pending (or failed) are fetched on their own
+      const section = async (name, path, params) => (
+        sections[name]?.status === 'ok' ? sections[name].data : (await api.get(path, { params })).data
+      );
+      const [profileData, coursesData, jobsData, leaderboardData] = await Promise.all([
+        section('profile', '/user/profile'),
+        section('courses', '/courses', { per_page: 3 }),
+        section('jobs', '/jobs/recommendations'),
+        section('leaderboard', '/leaderboard')
       ]);
 
-      const profile = profileRes.data.user;
+      const profile = profileData.user;
       setStats({
         completedCourses: profile.completed_courses,
         totalPoints: profile.points,
         currentStreak: 7, // This would come from backend
-        rank: leaderboardRes.data.leaderboard.findIndex(u => u.name === profile.full_name) + 1
+        rank: leaderboardData.me?.rank || 0
       });
 
       // Get recent courses (first 3)
-      setRecentCourses(coursesRes.data.courses.slice(0, 3));
+      setRecentCourses(coursesData.courses.slice(0, 3));
       
       // Get job recommendations (first 3)
-      setJobRecommendations(jobsRes.data.jobs.slice(0, 3));
+      setJobRecommendations(jobsData.jobs.slice(0, 3));
       
-      setLeaderboard(leaderboardRes.data.leaderboard.slice(0, 5));
+      setLeaderboard(leaderboardData.leaderboard.slice(0, 5));
       
     } catch (error) {
       console.error('Error fetching dashboard data:', error);
@@ -5,4 +5,49 @@ export const api = axios.create({
   headers: {
     'Content-Type': 'application/json',
   },
-});
\ No newline at end of file
+});
+
+// After a write the API may serve reads from a lagging replica. Echo the
+// X-Primary-Until it returns so our own changes are read back from the primary.
+api.interceptors.response.use((response) => {
+  const primaryUntil = response.headers['x-primary-until'];
+  if (primaryUntil) api.defaults.headers['X-Primary-Until'] = primaryUntil;
+  return response;
+});
+
+// Stream a chat reply over Server-Sent Events. Calls onToken for every chunk
+// as it arrives; abort the signal to cancel the request upstream.
+export const streamChat = async (message, { onToken, signal }) => {
+  const response = await fetch(`${api.defaults.baseURL}/chat/stream`, {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/json',
+      Authorization: api.defaults.headers.Authorization,
+    },
+    body: JSON.stringify({ message }),
+    signal,
+  });
+
+  if (!response.ok || !response.body) {
+    throw new Error(`Chat stream failed with status ${response.status}`);
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+
+  while (true) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+
+    const events = buffer.split('\n\n');
+    buffer = events.pop();
+    for (const raw of events) {
+      const event = raw.match(/^event: (.*)$/m)?.[1];
+      const data = JSON.parse(raw.match(/^data: (.*)$/m)?.[1] || '{}');
+      if (event === 'token') onToken(data.text);
+      if (event === 'error') throw new Error(data.message);
+    }
+  }
+};
@@ -0,0 +1,180 @@
+import logging
+import threading
+import time
+from collections import namedtuple
+
+# Event type -> UserStats counter it increments
+EVENT_COUNTERS = {
+    'assessment_completed': 'assessments_completed',
+    'course_completed': 'courses_completed',
+}
+
+STAT_COLUMNS = ('points',) + tuple(EVENT_COUNTERS.values())
+
+BadgeRule = namedtuple('BadgeRule', 'badge_id name description stat threshold')
+
+BADGE_RULES = [
+    BadgeRule('first_assessment', 'Self-Aware', 'Completed the learning style assessment', 'assessments_completed', 1),
+    BadgeRule('first_course', 'First Steps', 'Completed a first course', 'courses_completed', 1),
+    BadgeRule('five_courses', 'Dedicated Learner', 'Completed five courses', 'courses_completed', 5),
+    BadgeRule('ten_courses', 'Course Collector', 'Completed ten courses', 'courses_completed', 10),
+    BadgeRule('points_500', 'Rising Star', 'Earned 500 points', 'points', 500),
+    BadgeRule('points_2000', 'High Achiever', 'Earned 2,000 points', 'points', 2000),
+]
+
+
+def summarize(events):
+    """Per-user deltas for every stat column, e.g. ``{7: {'points': 300, 'courses_completed': 1, ...}}``"""
+    deltas = {}
+    for event in events:
+        delta = deltas.setdefault(event['user_id'], dict.fromkeys(STAT_COLUMNS, 0))
+        delta['points'] += event.get('points') or 0
+        counter = EVENT_COUNTERS.get(event['event_type'])
+        if counter:
+            delta[counter] += 1
+    return deltas
+
+
+class BadgeRules:
+    """Badge rules indexed by the statistic they watch.
+
+    Rules are threshold checks on a user's running totals, so a batch of
+    events only needs the rules for the stats it actually changed, evaluated
+    against the new totals; the event history is never re-scanned.
+    """
+
+    def __init__(self, rules=BADGE_RULES):
+        self.rules = {rule.badge_id: rule for rule in rules}
+        self.by_stat = {}
+        for rule in rules:
+            self.by_stat.setdefault(rule.stat, []).append(rule)
+
+    def earned(self, delta, totals, owned):
+        """Badge ids newly earned by a user whose stats moved by ``delta``"""
+        return [
+            rule.badge_id
+            for stat, change in delta.items() if change
+            for rule in self.by_stat.get(stat, ())
+            if rule.badge_id not in owned and (totals.get(stat) or 0) >= rule.threshold
+        ]
+
+    def describe(self, badge_id):
+        rule = self.rules.get(badge_id)
+        if rule is None:
+            return {'id': badge_id, 'name': badge_id}
+        return {'id': rule.badge_id, 'name': rule.name, 'description': rule.description}
+
+
+class WriteBehindBuffer:
+    """Buffers events in memory and hands them to ``flush`` in batches.
+
+    A background thread flushes every ``interval`` seconds, or sooner once
+    ``max_events`` are waiting, so many awards turn into one set of batched
+    statements. Events still buffered when a process dies are lost. A failed
+    batch is set aside and retried with exponential backoff, so it never
+    holds up newer events; after ``max_attempts`` its events are tried one by
+    one and those that still fail go to ``dead_letter(events, error)``. The
+    thread starts on first use and again after a fork.
+    """
+
+    def __init__(self, flush, interval=1.0, max_events=500, max_attempts=5, dead_letter=None, logger=None):
+        self._flush = flush
+        self.interval = interval
+        self.max_events = max_events
+        self.max_attempts = max_attempts
+        self._dead_letter = dead_letter
+        self.logger = logger or logging.getLogger(__name__)
+        self._events = []
+        self._retries = []  # [events, attempts, retry_at] per failed batch
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._worker = None
+        self.flushed = 0
+        self.failures = 0
+        self.dead_lettered = 0
+
+    def add(self, event):
+        self._ensure_worker()
+        with self._lock:
+            self._events.append(event)
+            if len(self._events) >= self.max_events:
+                self._wakeup.set()
+
+    def _ensure_worker(self):
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name='gamification-flush', daemon=True)
+                self._worker.start()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def flush(self, final=False):
+        """Apply everything buffered so far plus failed batches due for a retry
+
+        ``final`` retries every failed batch now, e.g. at exit. Returns the
+        number of events flushed.
+        """
+        now = time.monotonic()
+        with self._lock:
+            events, self._events = self._events, []
+            due = [batch for batch in self._retries if final or batch[2] <= now]
+            self._retries = [batch for batch in self._retries if not final and batch[2] > now]
+        flushed = self._attempt(events, 0) if events else 0
+        for batch_events, attempts, _ in due:
+            flushed += self._attempt(batch_events, attempts)
+        return flushed
+
+    def _attempt(self, events, attempts):
+        try:
+            self._flush(events)
+        except Exception as e:
+            self.failures += 1
+            attempts += 1
+            if attempts >= self.max_attempts:
+                return self._isolate(events, e)
+            delay = self.interval * 2 ** attempts
+            self.logger.warning(
+                'Gamification flush of %d events failed (attempt %d of %d), retrying in %.0fs: %s',
+                len(events), attempts, self.max_attempts, delay, e
+            )
+            with self._lock:
+                self._retries.append([events, attempts, time.monotonic() + delay])
+            return 0
+        self.flushed += len(events)
+        return len(events)
+
+    def _isolate(self, events, error):
+        """Last try: apply the events one at a time and dead-letter only those that still fail"""
+        flushed = 0
+        for event in events:
+            if len(events) > 1:
+                try:
+                    self._flush([event])
+                    flushed += 1
+                    continue
+                except Exception as e:
+                    error = e
+            self.dead_lettered += 1
+            self.logger.error('Dead-lettering gamification event after %d attempts: %s (%s)', self.max_attempts, event, error)
+            if self._dead_letter is not None:
+                try:
+                    self._dead_letter([event], error)
+                except Exception as e:
+                    self.logger.error('Writing a gamification dead letter failed: %s', e)
+        self.flushed += flushed
+        return flushed
+
+    def stats(self):
+        return {
+            'pending': len(self._events),
+            'retrying': sum(len(events) for events, _, _ in self._retries),
+            'flushed': self.flushed,
+            'failures': self.failures,
+            'dead_lettered': self.dead_lettered
+        }
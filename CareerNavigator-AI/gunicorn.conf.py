@@ -0,0 +1,44 @@
+# gunicorn -c gunicorn.conf.py app:app
+#
+# The app is imported once in the master (preload_app). With MODEL_WARMUP=eager
+# the NLP models load there too, so forked workers share the weights
+# copy-on-write instead of each holding its own copy.
+#
+# Every worker keeps its own metrics. They are merged through snapshot files in
+# PROMETHEUS_MULTIPROC_DIR, so whichever worker answers a /metrics scrape
+# reports the totals of all of them; the directory is emptied on startup.
+import os
+import shutil
+import tempfile
+
+bind = os.environ.get('BIND', '0.0.0.0:5000')
+workers = int(os.environ.get('WEB_CONCURRENCY', 4))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 8))
+timeout = 60
+preload_app = True
+
+# Set before the app is imported (preload_app), which reads it at import time
+metrics_dir = os.environ.setdefault(
+    'PROMETHEUS_MULTIPROC_DIR', os.path.join(tempfile.gettempdir(), f"careernavigator-metrics-{bind.rsplit(':', 1)[-1]}")
+)
+
+
+def on_starting(server):
+    # Snapshots left by a previous run would be added to this run's counters
+    shutil.rmtree(metrics_dir, ignore_errors=True)
+    os.makedirs(metrics_dir, exist_ok=True)
+
+
+def post_fork(server, worker):
+    from app import app, db, models
+
+    # Connections opened in the master must not be shared with workers. With
+    # close=False the master's connections are left alone and only forgotten.
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose(close=False)
+
+    # Threads do not survive fork, so background warm-up starts in each worker
+    if app.config['MODEL_WARMUP'] == 'background':
+        models.warm(['nlp', 'sentence_model', 'embeddings'])
@@ -0,0 +1,200 @@
+import csv
+import json
+import re
+import threading
+import zlib
+from datetime import datetime, timedelta
+from itertools import islice
+
+import numpy as np
+
+# Feed column -> accepted source names, first match wins
+FEED_FIELDS = {
+    'external_id': ('external_id', 'id', 'job_id'),
+    'title': ('title', 'job_title'),
+    'company': ('company', 'company_name', 'employer'),
+    'description': ('description', 'job_description'),
+    'requirements': ('requirements', 'skills', 'qualifications'),
+    'salary_range': ('salary_range', 'salary'),
+    'location': ('location', 'city'),
+    'job_type': ('job_type', 'employment_type', 'type'),
+}
+
+# Column sizes of the Job table
+FIELD_LIMITS = {'external_id': 200, 'title': 200, 'company': 200, 'salary_range': 100, 'location': 200, 'job_type': 50}
+
+WORD_RE = re.compile(r'\w+')
+
+# Mersenne prime 2^31 - 1 keeps a * x + b inside 64 bits
+MERSENNE_PRIME = (1 << 31) - 1
+
+
+def feed_format(filename, default='jsonl'):
+    name = (filename or '').lower()
+    if name.endswith('.csv'):
+        return 'csv'
+    if name.endswith(('.jsonl', '.ndjson', '.json')):
+        return 'jsonl'
+    return default
+
+
+def normalize_row(record):
+    """Map a feed record onto Job columns; None when it has no title"""
+    row = {}
+    for column, names in FEED_FIELDS.items():
+        value = next((record[name] for name in names if record.get(name) not in (None, '')), None)
+        if isinstance(value, (list, tuple)):
+            value = ', '.join(str(item) for item in value)
+        elif value is not None:
+            value = str(value).strip()
+        if value and column in FIELD_LIMITS:
+            value = value[:FIELD_LIMITS[column]]
+        row[column] = value or None
+    return row if row['title'] else None
+
+
+def iter_feed(lines, fmt, counts=None):
+    """Yield normalized job rows from an iterable of text lines, one at a time
+
+    Invalid records are skipped and counted in ``counts['invalid']``.
+    """
+    counts = counts if counts is not None else {}
+    if fmt == 'csv':
+        records = csv.DictReader(lines)
+    elif fmt == 'jsonl':
+        records = _json_lines(lines, counts)
+    else:
+        raise ValueError(f'Unsupported feed format {fmt}')
+    for record in records:
+        row = normalize_row(record) if isinstance(record, dict) else None
+        if row is None:
+            counts['invalid'] = counts.get('invalid', 0) + 1
+            continue
+        yield row
+
+
+def _json_lines(lines, counts):
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError:
+            counts['invalid'] = counts.get('invalid', 0) + 1
+
+
+def batched(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def duplicate_text(title, company, description):
+    """The text compared for near-duplicates"""
+    return ' '.join(part for part in (title, company, description) if part)
+
+
+class MinHasher:
+    """MinHash signatures over word shingles.
+
+    Words are hashed once with CRC32 and combined into shingle hashes with
+    array arithmetic; the ``num_perm`` hash functions are applied to every
+    shingle at once, so a signature costs a few vectorized passes.
+    """
+
+    def __init__(self, num_perm=64, shingle_size=3, seed=1):
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self._a = rng.integers(1, MERSENNE_PRIME, num_perm, dtype=np.uint64)[:, None]
+        self._b = rng.integers(0, MERSENNE_PRIME, num_perm, dtype=np.uint64)[:, None]
+
+    def signature(self, text):
+        words = WORD_RE.findall((text or '').lower())
+        hashes = np.fromiter((zlib.crc32(word.encode()) for word in words), dtype=np.uint64, count=len(words))
+        if not len(hashes):
+            return np.full(self.num_perm, MERSENNE_PRIME, dtype=np.uint32)
+        hashes %= MERSENNE_PRIME
+        size = min(self.shingle_size, len(hashes))
+        shingles = hashes[:len(hashes) - size + 1].copy()
+        for offset in range(1, size):
+            shingles = (shingles * 31 + hashes[offset:len(hashes) - size + 1 + offset]) % MERSENNE_PRIME
+        return ((self._a * shingles + self._b) % MERSENNE_PRIME).min(axis=1).astype(np.uint32)
+
+
+class NearDuplicateIndex:
+    """Locality-sensitive hashing over MinHash signatures.
+
+    Signatures are split into ``bands``; documents sharing any band are
+    candidates, and a candidate is a duplicate when the share of equal
+    signature slots (the Jaccard estimate) reaches ``threshold``. Lookups
+    only touch the documents in matching buckets, never the whole set.
+    """
+
+    def __init__(self, num_perm=64, bands=16, threshold=0.8):
+        if num_perm % bands:
+            raise ValueError('num_perm must be a multiple of bands')
+        self.rows = num_perm // bands
+        self.bands = bands
+        self.threshold = threshold
+        self._buckets = [{} for _ in range(bands)]
+        self._signatures = {}
+
+    def __len__(self):
+        return len(self._signatures)
+
+    def _keys(self, signature):
+        return [signature[band * self.rows:(band + 1) * self.rows].tobytes() for band in range(self.bands)]
+
+    def query(self, signature):
+        """Key of the most similar indexed document at or above the threshold, or None"""
+        candidates = set()
+        for buckets, key in zip(self._buckets, self._keys(signature)):
+            candidates.update(buckets.get(key, ()))
+        best, best_similarity = None, self.threshold
+        for candidate in candidates:
+            similarity = float(np.mean(self._signatures[candidate] == signature))
+            if similarity >= best_similarity:
+                best, best_similarity = candidate, similarity
+        return best
+
+    def add(self, key, signature):
+        self._signatures[key] = signature
+        for buckets, band_key in zip(self._buckets, self._keys(signature)):
+            buckets.setdefault(band_key, []).append(key)
+
+
+class RecentJobIndex:
+    """Near-duplicate index over recently posted jobs, kept between feed runs.
+
+    ``sync(load)`` catches up with jobs added since the last call, where
+    ``load(after_id, since)`` yields ``(id, title, company, description)`` for
+    jobs with a higher id posted after ``since``. Building the index costs a
+    signature per recent job, so it is rebuilt from scratch only once it is
+    ``rebuild_after`` old, which also drops postings that have aged out.
+    """
+
+    def __init__(self, hasher, days=30, threshold=0.8, rebuild_after=timedelta(days=1)):
+        self.hasher = hasher
+        self.days = days
+        self.threshold = threshold
+        self.rebuild_after = rebuild_after
+        self.index = None
+        self.last_id = 0
+        self.built_at = None
+        self._lock = threading.Lock()
+
+    def sync(self, load, now=None):
+        now = now or datetime.utcnow()
+        with self._lock:
+            if self.index is None or now - self.built_at >= self.rebuild_after:
+                self.index = NearDuplicateIndex(self.hasher.num_perm, threshold=self.threshold)
+                self.last_id, self.built_at = 0, now
+            for job_id, title, company, description in load(self.last_id, now - timedelta(days=self.days)):
+                self.index.add(job_id, self.hasher.signature(duplicate_text(title, company, description)))
+                self.last_id = max(self.last_id, job_id)
+            return self.index
@@ -0,0 +1,192 @@
+import math
+import random
+import threading
+import time
+
+_MAX_LEVELS = 24  # comfortably covers ~16M entries
+_TAIL_KEY = (math.inf, math.inf)
+
+
+class _Node:
+    __slots__ = ('key', 'next', 'width')
+
+    def __init__(self, key, levels):
+        self.key = key
+        self.next = [None] * levels
+        self.width = [1] * levels
+
+
+class IndexableSkipList:
+    """Sorted set of keys with O(log n) insert, remove, rank and positional access.
+
+    Every forward link records how many entries it skips, which is what lets
+    ``rank`` and ``__getitem__`` run in logarithmic time.
+    """
+
+    def __init__(self):
+        self.size = 0
+        self.tail = _Node(_TAIL_KEY, 0)
+        self.head = _Node(None, _MAX_LEVELS)
+        self.head.next = [self.tail] * _MAX_LEVELS
+
+    def __len__(self):
+        return self.size
+
+    def _random_levels(self):
+        levels = 1
+        while levels < _MAX_LEVELS and random.random() < 0.5:
+            levels += 1
+        return levels
+
+    def insert(self, key):
+        chain = [None] * _MAX_LEVELS
+        steps_at_level = [0] * _MAX_LEVELS
+        node = self.head
+        for level in reversed(range(_MAX_LEVELS)):
+            while node.next[level].key < key:
+                steps_at_level[level] += node.width[level]
+                node = node.next[level]
+            chain[level] = node
+
+        levels = self._random_levels()
+        new_node = _Node(key, levels)
+        steps = 0
+        for level in range(levels):
+            previous = chain[level]
+            new_node.next[level] = previous.next[level]
+            previous.next[level] = new_node
+            new_node.width[level] = previous.width[level] - steps
+            previous.width[level] = steps + 1
+            steps += steps_at_level[level]
+        for level in range(levels, _MAX_LEVELS):
+            chain[level].width[level] += 1
+        self.size += 1
+
+    def remove(self, key):
+        chain = [None] * _MAX_LEVELS
+        node = self.head
+        for level in reversed(range(_MAX_LEVELS)):
+            while node.next[level].key < key:
+                node = node.next[level]
+            chain[level] = node
+        target = chain[0].next[0]
+        if target.key != key:
+            raise KeyError(key)
+        for level in range(len(target.next)):
+            previous = chain[level]
+            previous.width[level] += target.width[level] - 1
+            previous.next[level] = target.next[level]
+        for level in range(len(target.next), _MAX_LEVELS):
+            chain[level].width[level] -= 1
+        self.size -= 1
+
+    def rank(self, key):
+        """Zero-based position of ``key``; raises KeyError if absent"""
+        position = 0
+        node = self.head
+        for level in reversed(range(_MAX_LEVELS)):
+            while node.next[level].key < key:
+                position += node.width[level]
+                node = node.next[level]
+        if node.next[0].key != key:
+            raise KeyError(key)
+        return position
+
+    def __getitem__(self, index):
+        if not 0 <= index < self.size:
+            raise IndexError(index)
+        remaining = index + 1
+        node = self.head
+        for level in reversed(range(_MAX_LEVELS)):
+            while node.width[level] <= remaining:
+                remaining -= node.width[level]
+                node = node.next[level]
+        return node.key
+
+    def first(self, n):
+        """The first ``n`` keys in order"""
+        keys = []
+        node = self.head.next[0]
+        while node is not self.tail and len(keys) < n:
+            keys.append(node.key)
+            node = node.next[0]
+        return keys
+
+
+class Leaderboard:
+    """In-memory ranked view of ``User.points``.
+
+    Users are kept in a global board and in one board per learning style.
+    Keys are ``(-points, user_id)`` so higher scores sort first and ties are
+    broken deterministically. The database stays the source of truth: the
+    boards are loaded from it on startup and periodically after
+    ``resync_interval`` seconds so other worker processes' awards show up.
+    """
+
+    GLOBAL = 'global'
+
+    def __init__(self, resync_interval=300):
+        self.resync_interval = resync_interval
+        self.loaded_at = None
+        self._boards = {}
+        self._users = {}
+        self._lock = threading.Lock()
+
+    @property
+    def stale(self):
+        return self.loaded_at is None or time.monotonic() - self.loaded_at > self.resync_interval
+
+    @staticmethod
+    def _user_boards(learning_style):
+        boards = [Leaderboard.GLOBAL]
+        if learning_style:
+            boards.append(f'style:{learning_style}')
+        return boards
+
+    def load(self, users):
+        """Replace all boards with ``(user_id, name, learning_style, points)`` rows"""
+        boards, entries = {}, {}
+        for user_id, name, learning_style, points in users:
+            points = points or 0
+            entries[user_id] = {'name': name, 'learning_style': learning_style, 'points': points}
+            for board in self._user_boards(learning_style):
+                boards.setdefault(board, IndexableSkipList()).insert((-points, user_id))
+        with self._lock:
+            self._boards, self._users = boards, entries
+            self.loaded_at = time.monotonic()
+
+    def set_points(self, user_id, points, name=None, learning_style=None):
+        """Record a user's current total, moving them between boards as needed"""
+        points = points or 0
+        with self._lock:
+            entry = self._users.get(user_id)
+            if entry is not None:
+                for board in self._user_boards(entry['learning_style']):
+                    self._boards[board].remove((-entry['points'], user_id))
+                name = name or entry['name']
+            entry = {'name': name, 'learning_style': learning_style, 'points': points}
+            self._users[user_id] = entry
+            for board in self._user_boards(learning_style):
+                self._boards.setdefault(board, IndexableSkipList()).insert((-points, user_id))
+
+    def top(self, n=10, board=GLOBAL):
+        with self._lock:
+            ranked = self._boards.get(board)
+            keys = ranked.first(n) if ranked else []
+            return [
+                dict(self._users[user_id], rank=i + 1, user_id=user_id)
+                for i, (_, user_id) in enumerate(keys)
+            ]
+
+    def rank(self, user_id, board=GLOBAL):
+        """Return ``{'rank', 'points', 'total'}`` for a user, or None if not on the board"""
+        with self._lock:
+            entry = self._users.get(user_id)
+            ranked = self._boards.get(board)
+            if entry is None or ranked is None:
+                return None
+            try:
+                position = ranked.rank((-entry['points'], user_id))
+            except KeyError:
+                return None
+            return {'rank': position + 1, 'points': entry['points'], 'total': len(ranked)}
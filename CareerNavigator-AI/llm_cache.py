@@ -0,0 +1,200 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+
+logger = logging.getLogger(__name__)
+
+
+def prompt_key(prompt, model_name):
+    """Content address for a prompt: whitespace-normalized text plus model name"""
+    normalized = ' '.join(prompt.split())
+    return hashlib.sha256(f'{model_name}\0{normalized}'.encode('utf-8')).hexdigest()
+
+
+class SQLiteTier:
+    """On-disk cache tier shared by every worker process on the host"""
+
+    def __init__(self, path, max_entries=10000):
+        self.path = path
+        self.max_entries = max_entries
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS llm_cache ('
+                'key TEXT PRIMARY KEY, value TEXT NOT NULL, '
+                'expires_at REAL NOT NULL, accessed_at REAL NOT NULL)'
+            )
+            conn.execute('CREATE INDEX IF NOT EXISTS ix_llm_cache_accessed ON llm_cache (accessed_at)')
+
+    def _connect(self):
+        # sqlite3 connections are not shareable across threads; opening one is cheap
+        return sqlite3.connect(self.path, timeout=5)
+
+    def get(self, key):
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute(
+                'SELECT value FROM llm_cache WHERE key = ? AND expires_at > ?', (key, now)
+            ).fetchone()
+            if row:
+                conn.execute('UPDATE llm_cache SET accessed_at = ? WHERE key = ?', (now, key))
+        return row[0] if row else None
+
+    def set(self, key, value, ttl):
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO llm_cache (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)',
+                (key, value, now + ttl, now)
+            )
+            conn.execute('DELETE FROM llm_cache WHERE expires_at <= ?', (now,))
+            conn.execute(
+                'DELETE FROM llm_cache WHERE key IN ('
+                'SELECT key FROM llm_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)',
+                (self.max_entries,)
+            )
+
+
+class PromptCache:
+    """Prompt-keyed cache for LLM completions.
+
+    Lookups go to an in-process LRU with a TTL first, then to the optional
+    SQLite tier. On a miss, concurrent callers asking for the same prompt are
+    coalesced so only one of them calls upstream; the rest wait up to
+    ``wait_timeout`` seconds for its result before calling upstream
+    themselves. Failures are never cached, and neither are completions the
+    caller's ``validate`` rejects.
+    """
+
+    def __init__(self, max_entries=512, ttl=86400, disk_path=None, disk_max_entries=10000, wait_timeout=60.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.wait_timeout = wait_timeout
+        self.disk = SQLiteTier(disk_path, disk_max_entries) if disk_path else None
+        self._entries = OrderedDict()
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.rejected = 0
+
+    def _get_memory(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def _set_memory(self, key, value):
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, prompt, model_name, compute, validate=None):
+        """Return the cached completion for ``prompt`` or call ``compute()`` once to fill it
+
+        ``validate(value)`` decides whether a fresh completion may be cached,
+        e.g. whether it parses; a rejected one is still returned, once.
+        """
+        key = prompt_key(prompt, model_name)
+
+        value = self._get_memory(key)
+        if value is not None:
+            self._count('hits')
+            return value
+
+        if self.disk is not None:
+            value = self.disk.get(key)
+            if value is not None:
+                self._count('disk_hits')
+                self._set_memory(key, value)
+                return value
+
+        with self._lock:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = Future()
+                self.misses += 1
+            else:
+                self.coalesced += 1
+        if not leader:
+            try:
+                return flight.result(timeout=self.wait_timeout)
+            except FutureTimeout:
+                # The leader is stuck; don't wait on it any longer
+                return compute()
+
+        try:
+            value = compute()
+        except BaseException as e:
+            flight.set_exception(e)
+            self._land(key)
+            raise
+        # Waiters get the value before any cache write can fail or stall
+        flight.set_result(value)
+        try:
+            if validate is None or self._valid(validate, value):
+                self._set_memory(key, value)
+                if self.disk is not None:
+                    try:
+                        self.disk.set(key, value, self.ttl)
+                    except Exception as e:
+                        # Best effort: the memory tier still has it
+                        logger.warning('Writing the LLM cache to disk failed: %s', e)
+            else:
+                self._count('rejected')
+        finally:
+            self._land(key)
+        return value
+
+    def _land(self, key):
+        with self._lock:
+            self._inflight.pop(key, None)
+
+    def _count(self, stat):
+        with self._lock:
+            setattr(self, stat, getattr(self, stat) + 1)
+
+    @staticmethod
+    def _valid(validate, value):
+        try:
+            return bool(validate(value))
+        except Exception:
+            return False
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        lookups = self.hits + self.disk_hits + self.misses + self.coalesced
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'coalesced': self.coalesced,
+            'evictions': self.evictions,
+            'rejected': self.rejected,
+            'hit_rate': (self.hits + self.disk_hits + self.coalesced) / lookups if lookups else 0.0
+        }
@@ -0,0 +1,304 @@
+import asyncio
+import queue
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+
+
+_STREAM_DONE = object()
+
+
+class LLMUnavailable(Exception):
+    """Raised when the upstream model cannot serve a request"""
+
+
+class LLMTimeout(LLMUnavailable):
+    """Raised when a single upstream call exceeds its timeout"""
+
+
+class LLMSaturated(LLMTimeout):
+    """Raised when no local call slot frees up in time; says nothing about upstream health"""
+
+
+class CircuitOpen(LLMUnavailable):
+    """Raised without calling upstream while the circuit breaker is open"""
+
+
+class CircuitBreaker:
+    """Classic closed / open / half-open breaker.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and
+    every call fails fast for ``reset_timeout`` seconds. It then lets a single
+    probe through; success closes it again, failure re-opens it.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+            if self.state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._probe_in_flight = False
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+    def release(self):
+        """End a call that says nothing about upstream health, freeing the half-open probe"""
+        with self._lock:
+            self._probe_in_flight = False
+
+
+class LLMGateway:
+    """Runs model calls on a bounded thread pool so request threads never wait unbounded.
+
+    Every call is subject to a concurrency semaphore, a per-call timeout,
+    retries with full-jitter exponential backoff and a circuit breaker.
+    ``model`` is anything with a Gemini-style ``generate_content(prompt)``
+    method, which makes the gateway easy to run against ``FakeGeminiModel``.
+    ``observer``, if given, is called as ``observer(kind, outcome, seconds,
+    usage)`` after every upstream attempt, where ``usage`` holds token counts
+    when the response reports them.
+    """
+
+    def __init__(self, model, max_concurrency=8, timeout=20.0, retries=2, backoff=0.5, breaker=None, observer=None):
+        self.model = model
+        self.observer = observer
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.breaker = breaker or CircuitBreaker()
+        self._semaphore = threading.BoundedSemaphore(max_concurrency)
+        # Timed-out calls keep running until upstream returns, so leave headroom
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency * 2, thread_name_prefix='llm')
+
+    @property
+    def available(self):
+        return self.breaker.state != CircuitBreaker.OPEN
+
+    def _observe(self, kind, outcome, started, response=None):
+        if self.observer is None:
+            return
+        try:
+            self.observer(kind, outcome, time.perf_counter() - started, token_usage(response))
+        except Exception:
+            pass
+
+    def _call(self, prompt, timeout):
+        started = time.perf_counter()
+        try:
+            response = self._call_upstream(prompt, timeout)
+        except LLMSaturated:
+            self._observe('generate', 'saturated', started)
+            raise
+        except LLMTimeout:
+            self._observe('generate', 'timeout', started)
+            raise
+        except Exception:
+            self._observe('generate', 'error', started)
+            raise
+        self._observe('generate', 'ok', started, response)
+        return response.text
+
+    def _call_upstream(self, prompt, timeout):
+        if not self._semaphore.acquire(timeout=timeout):
+            raise LLMSaturated('Too many concurrent LLM calls')
+        try:
+            future = self._executor.submit(self.model.generate_content, prompt)
+        except Exception:
+            self._semaphore.release()
+            raise
+        future.add_done_callback(lambda _: self._semaphore.release())
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeout:
+            future.cancel()
+            raise LLMTimeout(f'LLM call exceeded {timeout}s')
+
+    def generate(self, prompt, timeout=None):
+        """Return the model's text for ``prompt`` or raise ``LLMUnavailable``"""
+        timeout = timeout or self.timeout
+        last_error = None
+        for attempt in range(self.retries + 1):
+            if not self.breaker.allow():
+                raise CircuitOpen('LLM circuit is open') from last_error
+            try:
+                text = self._call(prompt, timeout)
+            except LLMSaturated:
+                # Local load: counting or retrying it would only cut off a healthy upstream
+                self.breaker.release()
+                raise
+            except Exception as e:
+                last_error = e
+                self.breaker.record_failure()
+                if attempt < self.retries:
+                    time.sleep(random.uniform(0, self.backoff * 2 ** attempt))
+                continue
+            self.breaker.record_success()
+            return text
+        if isinstance(last_error, LLMUnavailable):
+            raise last_error
+        raise LLMUnavailable(str(last_error)) from last_error
+
+    def stream(self, prompt, timeout=None):
+        """Yield text chunks as the model produces them
+
+        ``timeout`` bounds the wait for each chunk, including the first one.
+        Closing the generator (e.g. when the HTTP client disconnects) stops
+        reading from upstream so no further tokens are pulled. Streams are not
+        retried because part of the answer may already have been delivered.
+        """
+        timeout = timeout or self.timeout
+        if not self.breaker.allow():
+            raise CircuitOpen('LLM circuit is open')
+
+        chunks = queue.Queue()
+        cancelled = threading.Event()
+        started = time.perf_counter()
+        # True / False once upstream proved healthy / failed; None releases the breaker without a verdict
+        healthy = None
+        received = False
+
+        def produce():
+            response = last_chunk = None
+            try:
+                response = self.model.generate_content(prompt, stream=True)
+                for chunk in response:
+                    if cancelled.is_set():
+                        break
+                    last_chunk = chunk
+                    chunks.put(chunk.text)
+                chunks.put(_STREAM_DONE)
+                # Usage metadata arrives with the final chunk
+                self._observe('stream', 'cancelled' if cancelled.is_set() else 'ok', started, last_chunk)
+            except Exception as e:
+                self._observe('stream', 'error', started)
+                chunks.put(e)
+            finally:
+                if cancelled.is_set():
+                    close = getattr(response, 'cancel', None) or getattr(response, 'close', None)
+                    if close:
+                        close()
+
+        try:
+            # Local saturation, not an upstream failure
+            if not self._semaphore.acquire(timeout=timeout):
+                raise LLMSaturated('Too many concurrent LLM calls')
+            try:
+                future = self._executor.submit(produce)
+            except Exception:
+                self._semaphore.release()
+                raise
+            future.add_done_callback(lambda _: self._semaphore.release())
+
+            while True:
+                try:
+                    item = chunks.get(timeout=timeout)
+                except queue.Empty:
+                    healthy = False
+                    raise LLMTimeout(f'No tokens received for {timeout}s')
+                if item is _STREAM_DONE:
+                    healthy = True
+                    return
+                if isinstance(item, Exception):
+                    healthy = False
+                    raise LLMUnavailable(str(item)) from item
+                received = True
+                yield item
+        except GeneratorExit:
+            # The consumer went away; tokens already arriving show upstream is up
+            if received:
+                healthy = True
+            raise
+        finally:
+            cancelled.set()
+            if healthy is True:
+                self.breaker.record_success()
+            elif healthy is False:
+                self.breaker.record_failure()
+            else:
+                self.breaker.release()
+
+    async def agenerate(self, prompt, timeout=None):
+        """Awaitable variant of ``generate`` for asyncio callers"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.generate, prompt, timeout)
+
+
+def token_usage(response):
+    """``{'prompt': n, 'output': n}`` from a response's usage metadata, or None"""
+    usage = getattr(response, 'usage_metadata', None)
+    if usage is None:
+        return None
+    return {
+        'prompt': getattr(usage, 'prompt_token_count', 0) or 0,
+        'output': getattr(usage, 'candidates_token_count', 0) or 0
+    }
+
+
+class _FakeUsage:
+    def __init__(self, prompt, text):
+        # Whitespace tokens are close enough for load tests
+        self.prompt_token_count = len(prompt.split())
+        self.candidates_token_count = len(text.split())
+
+
+class _FakeResponse:
+    def __init__(self, text, usage_metadata=None):
+        self.text = text
+        self.usage_metadata = usage_metadata
+
+
+class FakeGeminiModel:
+    """Local stand-in for ``genai.GenerativeModel`` used in development and load tests"""
+
+    model_name = 'fake-gemini'
+
+    def __init__(self, latency=0.05, failure_rate=0.0, text=None):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.text = text
+
+    def generate_content(self, prompt, stream=False, **kwargs):
+        time.sleep(self.latency)
+        if random.random() < self.failure_rate:
+            raise RuntimeError('Fake Gemini failure')
+        text = self.text or f'[fake-gemini] {prompt.strip()[:200]}'
+        if stream:
+            return self._stream(text, _FakeUsage(prompt, text))
+        return _FakeResponse(text, _FakeUsage(prompt, text))
+
+    def _stream(self, text, usage, chunk_size=16):
+        for start in range(0, len(text), chunk_size):
+            last = start + chunk_size >= len(text)
+            yield _FakeResponse(text[start:start + chunk_size], usage if last else None)
+            time.sleep(self.latency / 10)
@@ -0,0 +1,414 @@
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows; saves are then only serialized within a process
+    fcntl = None
+
+import numpy as np
+from scipy import sparse
+
+# faiss and scikit-learn are imported where they are used so that importing
+# this module (and the app) stays cheap until an index is actually built.
+
+logger = logging.getLogger(__name__)
+
+# Skill tokens keep symbols that carry meaning ("c++", "c#", "node.js") and
+# never match inside a longer word, so "java" does not hit "javascript".
+SKILL_TOKEN_RE = re.compile(r'[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]')
+
+
+def job_document(job):
+    """Build the text that represents a job in embedding space; ``job`` is a Job or a row dict"""
+    if isinstance(job, dict):
+        parts = [job.get('title'), job.get('requirements'), job.get('description')]
+    else:
+        parts = [job.title, job.requirements, job.description]
+    return '. '.join(part for part in parts if part)
+
+
+class JobMatcher:
+    """Semantic job matching backed by a persistent FAISS inner-product index.
+
+    Job vectors are L2-normalized, so inner product equals cosine similarity.
+    Vectors are keyed by ``Job.id`` which lets postings be replaced or removed
+    in place without rebuilding the whole index.
+
+    Several processes (gunicorn workers, CLI commands) share one index file.
+    Each keeps the vectors it changed since it last synced with the file;
+    saves are debounced by ``save_interval`` seconds and merge those changes
+    into whatever another process wrote in the meantime, under a file lock.
+    Readers check the file at most every ``reload_interval`` seconds and pick
+    up a newer one, keeping their own unsaved changes on top.
+    """
+
+    def __init__(self, encoder, index_path, save_interval=10.0, reload_interval=10.0):
+        self.encoder = encoder
+        self.index_path = index_path
+        self.save_interval = save_interval
+        self.reload_interval = reload_interval
+        self.dimension = encoder.get_sentence_embedding_dimension()
+        self._lock = threading.RLock()
+        self._pending = {}  # job id -> vector, or None when removed, not yet in the file
+        self._save_timer = None
+        self._save_pid = None
+        self._checked_at = time.monotonic()
+        self._file_version = self._disk_version()
+        self.index = self._read_index() or self._new_index()
+
+    def _new_index(self):
+        import faiss
+        return faiss.IndexIDMap2(faiss.IndexFlatIP(self.dimension))
+
+    def _disk_version(self):
+        try:
+            stat = os.stat(self.index_path) if self.index_path else None
+        except OSError:
+            return None
+        return stat and (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def _read_index(self):
+        import faiss
+        if self.index_path and os.path.exists(self.index_path):
+            try:
+                index = faiss.read_index(self.index_path)
+                if index.d == self.dimension:
+                    return index
+            except RuntimeError:
+                pass
+        return None
+
+    def _apply(self, index, changes):
+        """Replay ``{job_id: vector or None}`` onto ``index``"""
+        if not changes:
+            return
+        index.remove_ids(np.fromiter(changes.keys(), dtype='int64', count=len(changes)))
+        added = [(job_id, vector) for job_id, vector in changes.items() if vector is not None]
+        if added:
+            index.add_with_ids(
+                np.stack([vector for _, vector in added]), np.array([job_id for job_id, _ in added], dtype='int64')
+            )
+
+    def _file_lock(self):
+        lock = open(self.index_path + '.lock', 'a')
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        return lock
+
+    def save(self, merge=True):
+        """Write the index file now, merging with a newer file written by another process"""
+        if not self.index_path:
+            return
+        directory = os.path.dirname(self.index_path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        import faiss
+        with self._lock, self._file_lock():
+            if merge and self._disk_version() != self._file_version:
+                disk = self._read_index()
+                if disk is not None:
+                    self._apply(disk, self._pending)
+                    self.index = disk
+            # A temp file per process, so concurrent writers never share one
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(self.index_path) + '.', suffix='.tmp')
+            os.close(fd)
+            try:
+                faiss.write_index(self.index, tmp_path)
+                os.replace(tmp_path, self.index_path)
+            except Exception:
+                os.unlink(tmp_path)
+                raise
+            self._pending.clear()
+            self._file_version = self._disk_version()
+
+    def flush(self):
+        """Save pending changes, e.g. at exit"""
+        if self._pending:
+            self.save()
+
+    def _schedule_save(self):
+        if self.save_interval <= 0:
+            self.save()
+            return
+        with self._lock:
+            # Timers do not survive a fork
+            if self._save_timer is not None and self._save_pid == os.getpid():
+                return
+            self._save_timer = threading.Timer(self.save_interval, self._scheduled_save)
+            self._save_timer.daemon = True
+            self._save_pid = os.getpid()
+            self._save_timer.start()
+
+    def _scheduled_save(self):
+        with self._lock:
+            self._save_timer = None
+        try:
+            self.save()
+        except Exception:
+            logger.exception('Saving the job index failed')
+
+    def refresh(self, force=False):
+        """Load a newer index file written by another process, keeping unsaved changes on top"""
+        if not self.index_path:
+            return False
+        now = time.monotonic()
+        if not force and now - self._checked_at < self.reload_interval:
+            return False
+        self._checked_at = now
+        version = self._disk_version()
+        if version is None or version == self._file_version:
+            return False
+        disk = self._read_index()
+        if disk is None:
+            return False
+        with self._lock:
+            self._apply(disk, self._pending)
+            self.index = disk
+            self._file_version = version
+        return True
+
+    def encode(self, texts):
+        vectors = self.encoder.encode(
+            list(texts), batch_size=64, normalize_embeddings=True, show_progress_bar=False
+        )
+        return np.ascontiguousarray(vectors, dtype='float32')
+
+    def __len__(self):
+        return self.index.ntotal
+
+    def indexed_ids(self):
+        import faiss
+        self.refresh()
+        with self._lock:
+            return faiss.vector_to_array(self.index.id_map).astype('int64')
+
+    def upsert_jobs(self, jobs, persist=True):
+        """Embed jobs once and insert or replace their vectors"""
+        self.upsert_documents(((job.id, job_document(job)) for job in jobs), persist=persist)
+
+    def upsert_documents(self, documents, persist=True):
+        """Insert or replace vectors for ``(job_id, text)`` pairs"""
+        documents = list(documents)
+        if not documents:
+            return
+        ids = np.array([job_id for job_id, _ in documents], dtype='int64')
+        vectors = self.encode(text for _, text in documents)
+        with self._lock:
+            self.index.remove_ids(ids)
+            self.index.add_with_ids(vectors, ids)
+            self._pending.update(zip(ids.tolist(), vectors))
+        if persist:
+            self._schedule_save()
+
+    def remove_jobs(self, job_ids, persist=True):
+        ids = np.array(list(job_ids), dtype='int64')
+        if not len(ids):
+            return
+        with self._lock:
+            self.index.remove_ids(ids)
+            self._pending.update(dict.fromkeys(ids.tolist()))
+        if persist:
+            self._schedule_save()
+
+    def rebuild(self, jobs):
+        """Re-embed every job into a fresh index and swap it in"""
+        jobs = list(jobs)
+        index = self._new_index()
+        if jobs:
+            ids = np.array([job.id for job in jobs], dtype='int64')
+            index.add_with_ids(self.encode(job_document(job) for job in jobs), ids)
+        with self._lock:
+            self.index = index
+            self._pending.clear()
+            # The rebuilt index is authoritative, so it replaces the file outright
+            self.save(merge=False)
+
+    def is_stale(self, job_ids):
+        """True when the indexed ids differ from the ids currently in the database"""
+        return set(self.indexed_ids().tolist()) != set(job_ids)
+
+    def profile_vector(self, skills):
+        """Embed a skill profile as one vector, weighting skills by proficiency
+
+        ``skills`` is a list of ``(skill_name, proficiency_level)`` pairs.
+        """
+        names = [name for name, _ in skills]
+        weights = np.array([level or 3 for _, level in skills], dtype='float32')
+        vector = weights @ self.encode(names)
+        norm = np.linalg.norm(vector)
+        if norm:
+            vector /= norm
+        return vector.reshape(1, -1)
+
+    def profile_vectors(self, profiles):
+        """Embed many skill profiles at once, encoding each distinct skill name only once"""
+        names = sorted({name for skills in profiles for name, _ in skills})
+        vectors = np.zeros((len(profiles), self.dimension), dtype='float32')
+        if not names:
+            return vectors
+        position = {name: i for i, name in enumerate(names)}
+        weights = sparse.lil_matrix((len(profiles), len(names)), dtype='float32')
+        for row, skills in enumerate(profiles):
+            for name, level in skills:
+                weights[row, position[name]] += level or 3
+        vectors = np.asarray(weights.tocsr() @ self.encode(names))
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return (vectors / np.where(norms == 0, 1, norms)).astype('float32')
+
+    def job_vectors(self):
+        """Return ``(job_ids, vectors)`` for every indexed job"""
+        import faiss
+        self.refresh()
+        with self._lock:
+            ids = faiss.vector_to_array(self.index.id_map).astype('int64')
+            vectors = self.index.index.reconstruct_n(0, self.index.ntotal)
+        return ids, vectors
+
+    def search(self, skills, k=10):
+        """Return ``[(job_id, similarity)]`` for the top-k jobs matching a skill profile"""
+        if not skills or not len(self):
+            return []
+        query = self.profile_vector(skills)
+        self.refresh()
+        with self._lock:
+            scores, ids = self.index.search(query, min(k, self.index.ntotal))
+        return [(int(job_id), float(score)) for job_id, score in zip(ids[0], scores[0]) if job_id != -1]
+
+
+def skill_tokens(text):
+    return SKILL_TOKEN_RE.findall(text.lower())
+
+
+class TfidfJobScorer:
+    """Sparse TF-IDF scorer over ``Job.requirements``.
+
+    The vectorizer is fitted once over all postings. New or edited postings
+    are transformed with the existing vocabulary and spliced into the matrix;
+    a full refit only happens after ``refit_ratio`` of the corpus has changed
+    since the last fit. Rows are L2-normalized, so one sparse product yields
+    cosine similarity against every job at once.
+    """
+
+    def __init__(self, refit_ratio=0.2):
+        self.refit_ratio = refit_ratio
+        self._lock = threading.Lock()
+        self._texts = {}
+        self._changed_since_fit = 0
+        self.vectorizer = None
+        self.job_ids = np.empty(0, dtype='int64')
+        self.matrix = sparse.csr_matrix((0, 0), dtype='float64')
+
+    def __len__(self):
+        return len(self.job_ids)
+
+    def _new_vectorizer(self):
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        return TfidfVectorizer(
+            tokenizer=skill_tokens, lowercase=False, token_pattern=None,
+            ngram_range=(1, 2), sublinear_tf=True
+        )
+
+    def fit(self, documents):
+        """Fit the vocabulary and matrix over ``(job_id, requirements)`` pairs"""
+        with self._lock:
+            self._texts = {job_id: text or '' for job_id, text in documents}
+            self._refit()
+
+    def _refit(self):
+        self._changed_since_fit = 0
+        job_ids = np.fromiter(self._texts.keys(), dtype='int64', count=len(self._texts))
+        if not len(job_ids):
+            self.vectorizer = None
+            self.job_ids, self.matrix = job_ids, sparse.csr_matrix((0, 0), dtype='float64')
+            return
+        vectorizer = self._new_vectorizer()
+        try:
+            matrix = vectorizer.fit_transform(self._texts.values()).tocsr()
+        except ValueError:
+            # Every document is empty; keep an empty vocabulary
+            vectorizer, matrix = None, sparse.csr_matrix((len(job_ids), 0), dtype='float64')
+        self.vectorizer, self.job_ids, self.matrix = vectorizer, job_ids, matrix
+
+    def upsert_documents(self, documents):
+        documents = {job_id: text or '' for job_id, text in documents}
+        if not documents:
+            return
+        with self._lock:
+            self._texts.update(documents)
+            self._changed_since_fit += len(documents)
+            if self.vectorizer is None or self._changed_since_fit > self.refit_ratio * len(self._texts):
+                self._refit()
+                return
+            keep = ~np.isin(self.job_ids, list(documents))
+            new_ids = np.fromiter(documents.keys(), dtype='int64', count=len(documents))
+            new_rows = self.vectorizer.transform(documents.values())
+            self.job_ids = np.concatenate([self.job_ids[keep], new_ids])
+            self.matrix = sparse.vstack([self.matrix[keep], new_rows], format='csr')
+
+    def remove(self, job_ids):
+        job_ids = list(job_ids)
+        if not job_ids:
+            return
+        with self._lock:
+            for job_id in job_ids:
+                self._texts.pop(job_id, None)
+            keep = ~np.isin(self.job_ids, job_ids)
+            self.job_ids, self.matrix = self.job_ids[keep], self.matrix[keep]
+
+    def score(self, profiles, embedding=None, alpha=1.0):
+        """Score every profile against every job with one sparse product
+
+        Returns ``(job_ids, scores)`` where ``scores`` is a dense
+        ``len(profiles) x len(job_ids)`` array of similarities in [0, 1].
+        ``embedding`` is an optional ``(job_ids, profile_vectors, job_vectors)``
+        triple from the semantic matcher; when given the two signals are
+        blended as ``alpha * tfidf + (1 - alpha) * embedding``.
+        """
+        with self._lock:
+            vectorizer, job_ids, matrix = self.vectorizer, self.job_ids, self.matrix
+        if vectorizer is None:
+            return job_ids, np.zeros((len(profiles), len(job_ids)))
+        scores = (vectorizer.transform(', '.join(skills) for skills in profiles) @ matrix.T).toarray()
+        if embedding is not None and alpha < 1.0:
+            embedding_ids, profile_vectors, job_vectors = embedding
+            column = {job_id: i for i, job_id in enumerate(embedding_ids.tolist())}
+            columns = np.array([column.get(job_id, -1) for job_id in job_ids.tolist()], dtype='int64')
+            similarities = profile_vectors @ job_vectors[np.maximum(columns, 0)].T
+            similarities[:, columns < 0] = 0.0
+            scores = alpha * scores + (1 - alpha) * np.clip(similarities, 0, 1)
+        return job_ids, scores
+
+    def rank(self, profiles, k=10, embedding=None, alpha=1.0, chunk_size=256):
+        """Return the top-k ``[(job_id, score)]`` list for each profile
+
+        Profiles are scored ``chunk_size`` at a time so the dense score block
+        stays bounded no matter how many users are ranked in one call.
+        """
+        results = []
+        for start in range(0, len(profiles), chunk_size):
+            chunk = profiles[start:start + chunk_size]
+            chunk_embedding = None
+            if embedding is not None:
+                embedding_ids, profile_vectors, job_vectors = embedding
+                chunk_embedding = (embedding_ids, profile_vectors[start:start + chunk_size], job_vectors)
+            job_ids, scores = self.score(chunk, embedding=chunk_embedding, alpha=alpha)
+            results.extend(top_k(job_ids, scores, k))
+        return results
+
+
+def top_k(job_ids, scores, k):
+    """Pick the k best columns of each row of a score matrix, best first"""
+    k = min(k, len(job_ids))
+    if not k:
+        return [[] for _ in range(len(scores))]
+    top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    rows = np.arange(len(scores))[:, None]
+    top = top[rows, np.argsort(-scores[rows, top], axis=1)]
+    return [
+        [(int(job_ids[col]), float(scores[row, col])) for col in top[row]]
+        for row in range(len(scores))
+    ]
@@ -0,0 +1,277 @@
+import json
+import logging
+import math
+import os
+import tempfile
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Prometheus' default latency buckets, in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _labels(names, values, extra=()):
+    pairs = list(zip(names, values)) + list(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+def _number(value):
+    if value == math.inf:
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _sum_states(states):
+    values = {}
+    for _, state in states:
+        for key, value in state.items():
+            values[key] = values.get(key, 0) + value
+    return values
+
+
+def _alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class Counter:
+    """Monotonic counter, one series per label combination"""
+
+    kind = 'counter'
+
+    def __init__(self, name, help, labels=()):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = tuple(str(labels.get(name, '')) for name in self.label_names)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def state(self):
+        with self._lock:
+            return dict(self._values)
+
+    def merge(self, states):
+        """Sum of the per-process ``states``"""
+        return _sum_states(states)
+
+    def samples(self, state=None):
+        values = self.state() if state is None else state
+        return [(self.name, _labels(self.label_names, key), value) for key, value in sorted(values.items())]
+
+
+class Histogram:
+    """Cumulative-bucket histogram, one series per label combination"""
+
+    kind = 'histogram'
+
+    def __init__(self, name, help, labels=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        key = tuple(str(labels.get(name, '')) for name in self.label_names)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[0][i] += 1
+                    break
+            series[1] += value
+            series[2] += 1
+
+    def state(self):
+        with self._lock:
+            return {key: (list(counts), total, count) for key, (counts, total, count) in self._series.items()}
+
+    def merge(self, states):
+        """Bucket-wise sum of the per-process ``states``"""
+        series = {}
+        for _, state in states:
+            for key, (counts, total, count) in state.items():
+                merged = series.setdefault(key, ([0] * len(self.buckets), 0.0, 0))
+                series[key] = ([a + b for a, b in zip(merged[0], counts)], merged[1] + total, merged[2] + count)
+        return series
+
+    def samples(self, state=None):
+        series = self.state() if state is None else state
+        samples = []
+        for key, (counts, total, count) in sorted(series.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                samples.append((f'{self.name}_bucket', _labels(self.label_names, key, [('le', _number(bound))]), cumulative))
+            samples.append((f'{self.name}_sum', _labels(self.label_names, key), total))
+            samples.append((f'{self.name}_count', _labels(self.label_names, key), count))
+        return samples
+
+
+class Collected:
+    """Metric whose values are read from ``collect()`` at scrape time
+
+    ``collect`` returns a number, or a dict of label-value tuples to numbers.
+    Used for state other components already track, like cache hit counts.
+    """
+
+    def __init__(self, name, help, collect, labels=(), kind='gauge'):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+        self.kind = kind
+        self._collect = collect
+
+    def state(self):
+        values = self._collect()
+        if values is None:
+            return {}
+        if not isinstance(values, dict):
+            values = {(): values}
+        return {
+            tuple(str(part) for part in (key if isinstance(key, tuple) else (key,))): value
+            for key, value in values.items() if value is not None
+        }
+
+    def merge(self, states):
+        """Counters are summed; gauges are kept per live process under a ``pid`` label"""
+        if self.kind == 'counter':
+            return _sum_states(states)
+        return {key + (pid,): value for pid, state in states if _alive(int(pid)) for key, value in state.items()}
+
+    def samples(self, state=None):
+        values = self.state() if state is None else state
+        names = self.label_names
+        if values and len(next(iter(values))) > len(names):
+            names += ('pid',)
+        return [(self.name, _labels(names, key), value) for key, value in sorted(values.items())]
+
+
+class MetricsRegistry:
+    """Named metrics rendered in the Prometheus text exposition format
+
+    Values live in process memory. Under a preforking server each worker would
+    answer a scrape with only its own share, so with ``multiprocess_dir`` set
+    every process writes a snapshot of its values there (``sync``, at most
+    every ``sync_interval`` seconds) and ``render`` merges the snapshots of all
+    processes. The directory must be emptied when the server starts.
+    """
+
+    def __init__(self, multiprocess_dir=None, sync_interval=1.0):
+        self._metrics = {}
+        self._lock = threading.Lock()
+        self.multiprocess_dir = multiprocess_dir
+        self.sync_interval = sync_interval
+        self._synced_at = None
+
+    def _register(self, metric):
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f'Metric {metric.name} is already registered')
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name, help, labels=()):
+        return self._register(Counter(name, help, labels))
+
+    def histogram(self, name, help, labels=(), buckets=DEFAULT_BUCKETS):
+        return self._register(Histogram(name, help, labels, buckets))
+
+    def collected(self, name, help, collect, labels=(), kind='gauge'):
+        return self._register(Collected(name, help, collect, labels, kind))
+
+    def _states(self, metrics):
+        states = {}
+        for metric in metrics:
+            try:
+                states[metric.name] = metric.state()
+            except Exception:
+                # One broken collector should not take the whole scrape down
+                logger.exception('Could not collect %s', metric.name)
+        return states
+
+    def sync(self, force=False):
+        """Write this process's values to ``multiprocess_dir``, unless written within ``sync_interval``"""
+        if not self.multiprocess_dir:
+            return False
+        now = time.monotonic()
+        if not force and self._synced_at is not None and now - self._synced_at < self.sync_interval:
+            return False
+        self._synced_at = now
+        with self._lock:
+            metrics = list(self._metrics.values())
+        snapshot = {
+            name: [[list(key), value] for key, value in state.items()]
+            for name, state in self._states(metrics).items()
+        }
+        os.makedirs(self.multiprocess_dir, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.multiprocess_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as snapshot_file:
+                json.dump(snapshot, snapshot_file, default=float)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        os.replace(temp_path, os.path.join(self.multiprocess_dir, f'{os.getpid()}.json'))
+        return True
+
+    def _merged_states(self, metrics):
+        """``{name: state}`` merged from every process's snapshot"""
+        self.sync(force=True)
+        snapshots = []
+        for file_name in os.listdir(self.multiprocess_dir):
+            pid, extension = os.path.splitext(file_name)
+            if extension != '.json' or not pid.isdigit():
+                continue
+            try:
+                with open(os.path.join(self.multiprocess_dir, file_name), encoding='utf-8') as snapshot_file:
+                    snapshots.append((pid, json.load(snapshot_file)))
+            except (OSError, ValueError):
+                continue  # a worker exited or is mid-replace; its next snapshot counts
+        return {
+            metric.name: metric.merge([
+                (pid, {tuple(key): value if metric.kind != 'histogram' else tuple(value) for key, value in snapshot[metric.name]})
+                for pid, snapshot in snapshots if metric.name in snapshot
+            ])
+            for metric in metrics
+        }
+
+    def render(self):
+        with self._lock:
+            metrics = list(self._metrics.values())
+        states = self._merged_states(metrics) if self.multiprocess_dir else self._states(metrics)
+        lines = []
+        for metric in metrics:
+            if metric.name not in states:
+                continue
+            try:
+                samples = metric.samples(states[metric.name])
+            except Exception:
+                # One broken collector should not take the whole scrape down
+                logger.exception('Could not collect %s', metric.name)
+                continue
+            lines.append(f'# HELP {metric.name} {metric.help}')
+            lines.append(f'# TYPE {metric.name} {metric.kind}')
+            lines.extend(f'{name}{labels} {_number(value)}' for name, labels, value in samples)
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,110 @@
+from sqlalchemy import Column, Index, MetaData, Table, and_, delete, exists, func, inspect, select, update
+from sqlalchemy.schema import CreateIndex
+
+
+def missing_columns(connection, metadata):
+    """``(table, column)`` pairs declared on the models but absent from the database"""
+    inspector = inspect(connection)
+    tables = set(inspector.get_table_names())
+    missing = []
+    for table in metadata.sorted_tables:
+        if table.name not in tables:
+            continue  # create_all creates it whole
+        existing = {column['name'] for column in inspector.get_columns(table.name)}
+        missing.extend((table, column) for column in table.columns if column.name not in existing)
+    return missing
+
+
+def add_column(connection, table, column):
+    """``ALTER TABLE ... ADD COLUMN`` for a column added to a model after its table was created
+
+    Columns are added nullable; a NOT NULL column needs a server default,
+    otherwise existing rows could not satisfy it.
+    """
+    if not column.nullable and column.server_default is None and not column.primary_key:
+        raise RuntimeError(f'{table.name}.{column.name} is NOT NULL without a server default; migrate it by hand')
+    preparer = connection.dialect.identifier_preparer
+    column_type = column.type.compile(dialect=connection.dialect)
+    default = ''
+    if column.server_default is not None:
+        default = f' DEFAULT {column.server_default.arg}'
+    connection.exec_driver_sql(
+        f'ALTER TABLE {preparer.format_table(table)} ADD COLUMN {preparer.format_column(column)} {column_type}{default}'
+    )
+
+
+def has_index(connection, table_name, name):
+    """Whether ``table_name`` has an index or unique constraint called ``name``"""
+    inspector = inspect(connection)
+    names = {existing['name'] for existing in inspector.get_indexes(table_name)}
+    names.update(existing['name'] for existing in inspector.get_unique_constraints(table_name))
+    return name in names
+
+
+def ensure_index(connection, index):
+    """Create ``index`` unless an index of that name already exists on its table"""
+    if not has_index(connection, index.table.name, index.name):
+        connection.execute(CreateIndex(index))
+        return True
+    return False
+
+
+def ensure_unique(connection, table, name, columns):
+    """Add a unique index ``name`` on ``columns`` unless ``table`` already has one of that name
+
+    For constraints declared on a model after its table was created. The index
+    is built on a detached copy of the table, so the model's metadata, which
+    ``create_all`` reads, is left alone.
+    """
+    detached = Table(table.name, MetaData(), *(Column(column, table.c[column].type) for column in columns), schema=table.schema)
+    return ensure_index(connection, Index(name, *(detached.c[column] for column in columns), unique=True))
+
+
+def dedupe(connection, table, columns, merge=None):
+    """Delete rows repeating an earlier row's ``columns``, so a unique index on them can be added
+
+    The row with the lowest id in each group is kept. ``merge`` maps column
+    names to aggregate functions (e.g. ``func.max``) whose value over the
+    group is written to the kept row first. Returns the number of rows deleted.
+    """
+    other = table.alias('duplicate')
+    same_key = and_(*(other.c[column] == table.c[column] for column in columns))
+    if merge:
+        grouped = table.alias('grouped')
+        kept = select(func.min(grouped.c.id)).group_by(*(grouped.c[column] for column in columns)).having(func.count() > 1)
+        connection.execute(update(table).where(table.c.id.in_(kept)).values({
+            column: select(aggregate(other.c[column])).where(same_key).scalar_subquery()
+            for column, aggregate in merge.items()
+        }))
+    result = connection.execute(delete(table).where(exists().where(same_key, other.c.id < table.c.id)))
+    return result.rowcount
+
+
+class SchemaUpgrade:
+    """Idempotent schema upgrades for databases created by older versions.
+
+    ``db.create_all()`` only creates missing tables; it never adds columns,
+    indexes or constraints to tables that already exist. ``run`` first adds
+    every missing column, then applies the registered steps in order. Each
+    step inspects the live schema or data and only changes what is missing,
+    so the whole upgrade can run on every deploy (``flask upgrade-db``).
+    """
+
+    def __init__(self):
+        self.steps = []
+
+    def step(self, description):
+        """Register ``function(connection)`` as an upgrade step, in definition order"""
+        def register(function):
+            self.steps.append((description, function))
+            return function
+        return register
+
+    def run(self, engine, metadata, log=print):
+        with engine.begin() as connection:
+            for table, column in missing_columns(connection, metadata):
+                add_column(connection, table, column)
+                log(f'Added column {table.name}.{column.name}')
+            for description, function in self.steps:
+                if function(connection):
+                    log(description)
@@ -0,0 +1,117 @@
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class ModelUnavailable(RuntimeError):
+    """Raised by a loader when a model it depends on could not be loaded"""
+
+
+class ModelRegistry:
+    """Loads heavy models on demand or in the background, once per process.
+
+    Loaders are plain callables registered by name. ``get`` loads a model on
+    first use (blocking), while ``peek`` never blocks and returns None until
+    the model is ready, which lets request handlers fall back to cheaper code
+    paths during warm-up. Loading in the gunicorn master with ``preload_app``
+    lets forked workers share the weights copy-on-write.
+
+    A failed load is retried on a later ``get`` or ``warm`` once a cooldown of
+    ``retry_after`` seconds has passed, doubling with every consecutive
+    failure up to ``max_retry_after``, so a transient error (a network blip
+    during a model download) does not disable the model for good.
+    """
+
+    def __init__(self, retry_after=30.0, max_retry_after=900.0):
+        self.retry_after = retry_after
+        self.max_retry_after = max_retry_after
+        self._loaders = {}
+        self._models = {}
+        self._errors = {}
+        self._failures = {}  # name -> (consecutive failures, monotonic time of the last)
+        self._locks = {}
+        self._load_seconds = {}
+        self._loading = set()
+        self._lock = threading.Lock()
+
+    def register(self, name, loader):
+        self._loaders[name] = loader
+        self._locks[name] = threading.Lock()
+
+    def _cooling_down(self, name):
+        """Whether ``name`` failed recently enough that it should not be retried yet"""
+        if name not in self._errors:
+            return False
+        failures, failed_at = self._failures[name]
+        cooldown = min(self.retry_after * 2 ** (failures - 1), self.max_retry_after)
+        return time.monotonic() - failed_at < cooldown
+
+    def _load(self, name):
+        with self._locks[name]:
+            if name in self._models or self._cooling_down(name):
+                return self._models.get(name)
+            with self._lock:
+                self._loading.add(name)
+            start = time.perf_counter()
+            try:
+                self._models[name] = self._loaders[name]()
+                self._errors.pop(name, None)
+                self._failures.pop(name, None)
+            except Exception as e:
+                self._errors[name] = e
+                failures = self._failures.get(name, (0, 0.0))[0] + 1
+                self._failures[name] = (failures, time.monotonic())
+                logger.warning("Model '%s' not loaded (attempt %d): %s", name, failures, e)
+            finally:
+                self._load_seconds[name] = time.perf_counter() - start
+                with self._lock:
+                    self._loading.discard(name)
+            return self._models.get(name)
+
+    def get(self, name):
+        """Return the model, loading it now if needed; None if loading failed and is cooling down"""
+        if name in self._models:
+            return self._models[name]
+        return self._load(name)
+
+    def peek(self, name):
+        """Return the model only if it is already loaded"""
+        return self._models.get(name)
+
+    def warm(self, names=None, background=True):
+        """Load models that are not loaded yet, optionally in a daemon thread"""
+        names = [name for name in (names or self._loaders) if name not in self._models and not self._cooling_down(name)]
+        if not names:
+            return None
+        if not background:
+            for name in names:
+                self._load(name)
+            return None
+        thread = threading.Thread(target=lambda: [self._load(name) for name in names], name='model-warmup', daemon=True)
+        thread.start()
+        return thread
+
+    def status(self):
+        statuses = {}
+        for name in self._loaders:
+            if name in self._models:
+                state = 'ready'
+            elif name in self._loading:
+                state = 'loading'
+            elif name in self._errors:
+                state = 'failed'
+            else:
+                state = 'not_loaded'
+            statuses[name] = {'state': state}
+            if name in self._load_seconds:
+                statuses[name]['load_seconds'] = round(self._load_seconds[name], 3)
+            if name in self._errors:
+                statuses[name]['error'] = str(self._errors[name])
+                statuses[name]['failures'] = self._failures[name][0]
+        return statuses
+
+    def settled(self, names=None):
+        """True once every named model has either loaded or failed"""
+        return all(name in self._models or name in self._errors for name in (names or self._loaders))
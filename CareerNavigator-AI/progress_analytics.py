@@ -0,0 +1,62 @@
+from datetime import timedelta
+
+# Funnel stages by progress percentage; 0 means the course was started
+FUNNEL_STAGES = (0, 25, 50, 75, 100)
+
+
+def week_start(moment):
+    """Monday of the week ``moment`` falls in, as a date"""
+    day = moment.date() if hasattr(moment, 'date') else moment
+    return day - timedelta(days=day.weekday())
+
+
+def stages_crossed(previous, current):
+    """Funnel stages newly reached when furthest progress moves from ``previous`` to ``current``
+
+    ``previous`` is None for a user's first event on a course.
+    """
+    if previous is None:
+        return [stage for stage in FUNNEL_STAGES if stage <= current]
+    return [stage for stage in FUNNEL_STAGES if previous < stage <= current]
+
+
+def summarize(events):
+    """Rollup deltas for a batch of progress events
+
+    ``events`` are dicts with ``user_id``, ``course_id``,
+    ``progress_percentage``, ``previous_max`` and ``created_at``. Returns
+    ``{'users': {user_id: delta}, 'weeks': {(user_id, week): delta},
+    'funnel': {(course_id, stage): users}}``, each delta a dict of counter
+    increments.
+    """
+    users, weeks, funnel = {}, {}, {}
+    for event in events:
+        crossed = stages_crossed(event['previous_max'], event['progress_percentage'])
+        completed = int(FUNNEL_STAGES[-1] in crossed)
+        user = users.setdefault(event['user_id'], {'courses_started': 0, 'courses_completed': 0, 'events': 0, 'last_active_at': None})
+        user['courses_started'] += int(event['previous_max'] is None)
+        user['courses_completed'] += completed
+        user['events'] += 1
+        if user['last_active_at'] is None or event['created_at'] > user['last_active_at']:
+            user['last_active_at'] = event['created_at']
+        week = weeks.setdefault((event['user_id'], week_start(event['created_at'])), {'events': 0, 'completions': 0})
+        week['events'] += 1
+        week['completions'] += completed
+        for stage in crossed:
+            funnel[(event['course_id'], stage)] = funnel.get((event['course_id'], stage), 0) + 1
+    return {'users': users, 'weeks': weeks, 'funnel': funnel}
+
+
+def funnel_report(counts):
+    """Per-stage users, conversion and drop-off from ``{stage: users}``"""
+    report, previous = [], None
+    for stage in FUNNEL_STAGES:
+        users = counts.get(stage, 0)
+        report.append({
+            'stage': stage,
+            'users': users,
+            'conversion': round(users / previous, 4) if previous else None,
+            'drop_off': previous - users if previous is not None else None
+        })
+        previous = users
+    return report
@@ -0,0 +1,99 @@
+import io
+import json
+import os
+import re
+import zipfile
+
+from skill_taxonomy import SkillTaxonomy
+
+# Entity labels worth checking against the taxonomy (tools and languages
+# are usually tagged as products or organisations by the small English model)
+SKILL_ENTITY_LABELS = {'ORG', 'PRODUCT', 'LANGUAGE', 'WORK_OF_ART'}
+
+# Pipes the skill extractor does not use; disabling them roughly halves spaCy time
+UNUSED_PIPES = ('parser', 'tagger', 'attribute_ruler', 'lemmatizer', 'senter')
+
+
+def proficiency_from_mentions(mentions):
+    """Rough 1-5 proficiency from how often a skill is mentioned"""
+    return min(1 + mentions, 5)
+
+
+class ResumeSkillExtractor:
+    """Extracts normalized skills from resumes with a loaded spaCy pipeline
+
+    ``taxonomy`` finds known skills in the text and normalizes entity mentions.
+    """
+
+    def __init__(self, nlp, taxonomy=None):
+        self.nlp = nlp
+        self.taxonomy = taxonomy if taxonomy is not None else SkillTaxonomy.from_vocabulary()
+        self.disabled = [name for name in getattr(nlp, 'pipe_names', []) if name in UNUSED_PIPES]
+
+    def _skills(self, doc):
+        counts = self.taxonomy.find(doc.text)
+        for ent in doc.ents:
+            if ent.label_ in SKILL_ENTITY_LABELS:
+                name = self.taxonomy.normalize(ent.text)
+                # Entities already counted by the alias scan only confirm the skill
+                if name and name not in counts:
+                    counts[name] += 1
+        return {name: proficiency_from_mentions(mentions) for name, mentions in counts.items()}
+
+    def extract(self, text):
+        """Return ``{skill_name: proficiency_level}`` for one resume"""
+        if not text:
+            return {}
+        skills, _ = next(self.extract_many([(text, None)]))
+        return skills
+
+    def extract_many(self, items, batch_size=64, n_process=1):
+        """Stream ``(text, context)`` pairs through ``nlp.pipe``; yields ``(skills, context)``"""
+        kwargs = {'batch_size': batch_size, 'n_process': n_process, 'as_tuples': True}
+        if self.disabled:
+            kwargs['disable'] = self.disabled
+        for doc, context in self.nlp.pipe(items, **kwargs):
+            yield self._skills(doc), context
+
+
+def read_resume(filename, data):
+    """Plain text from an uploaded resume (.txt, .md, .docx or .pdf)"""
+    extension = os.path.splitext(filename or '')[1].lower()
+    if extension == '.docx':
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            xml = archive.read('word/document.xml').decode('utf-8')
+        xml = re.sub(r'</w:p>', '\n', xml)
+        return re.sub(r'<[^>]+>', '', xml)
+    if extension == '.pdf':
+        try:
+            from pypdf import PdfReader
+        except ImportError:
+            raise ValueError('PDF resumes require the pypdf package')
+        return '\n'.join(page.extract_text() or '' for page in PdfReader(io.BytesIO(data)).pages)
+    if extension in ('', '.txt', '.md', '.text'):
+        return data.decode('utf-8', errors='replace')
+    raise ValueError(f'Unsupported resume format: {extension}')
+
+
+def iter_resumes(path):
+    """Yield ``(user_key, text)`` from a JSONL file or a directory of resume files
+
+    JSONL lines carry ``user_id`` or ``email`` plus ``text``. In a directory the
+    file name without its extension is the user's id or email.
+    """
+    if os.path.isdir(path):
+        for entry in sorted(os.scandir(path), key=lambda entry: entry.name):
+            if not entry.is_file():
+                continue
+            with open(entry.path, 'rb') as f:
+                try:
+                    text = read_resume(entry.name, f.read())
+                except ValueError:
+                    continue
+            yield os.path.splitext(entry.name)[0], text
+        return
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                yield record.get('user_id') or record.get('email'), record.get('text', '')
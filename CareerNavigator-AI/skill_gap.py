@@ -0,0 +1,71 @@
+import heapq
+from collections import Counter
+
+DIFFICULTY_ORDER = {'beginner': 0, 'intermediate': 1, 'advanced': 2}
+
+
+class SkillGapRecommender:
+    """Picks the fewest catalog courses that teach a set of missing skills.
+
+    Built once per catalog load from course dicts carrying ``skill_ids``. An
+    inverted index maps each skill id to the courses teaching it, so a query
+    only ever looks at courses relevant to the gap. Selection is the greedy
+    set-cover heuristic (lazily re-scored with a heap, since a course's gain
+    can only shrink), and the chosen courses are returned easiest first.
+    """
+
+    def __init__(self, courses):
+        self.courses = {course['id']: course for course in courses}
+        self.course_skills = {}
+        self.courses_by_skill = {}
+        self.difficulty = {}
+        for course in courses:
+            self.difficulty[course['id']] = DIFFICULTY_ORDER.get((course.get('difficulty') or '').lower(), 1)
+            skills = frozenset(course.get('skill_ids') or ())
+            self.course_skills[course['id']] = skills
+            for skill_id in skills:
+                self.courses_by_skill.setdefault(skill_id, []).append(course['id'])
+
+    @staticmethod
+    def missing(user_skill_ids, job_skill_ids):
+        return set(job_skill_ids) - set(user_skill_ids)
+
+    def cover(self, missing_skill_ids, max_courses=None):
+        """Return ``(plan, uncovered)`` for a set of missing skill ids
+
+        ``plan`` is a list of ``(course, covered_skill_ids)`` ordered by
+        difficulty; ``uncovered`` holds skills no course teaches (or that did
+        not fit within ``max_courses``).
+        """
+        uncovered = {skill_id for skill_id in missing_skill_ids if skill_id in self.courses_by_skill}
+        unteachable = set(missing_skill_ids) - uncovered
+        gains = Counter(course_id for skill_id in uncovered for course_id in self.courses_by_skill[skill_id])
+        # Ties go to easier, then more focused courses, then the lower id
+        heap = [
+            (-gain, self.difficulty[course_id], len(self.course_skills[course_id]), course_id)
+            for course_id, gain in gains.items()
+        ]
+        heapq.heapify(heap)
+
+        chosen = []
+        while uncovered and heap and (max_courses is None or len(chosen) < max_courses):
+            _, difficulty, size, course_id = heapq.heappop(heap)
+            gain = self.course_skills[course_id] & uncovered
+            if not gain:
+                continue
+            # Gains only shrink, so a stale entry is re-scored and pushed back
+            if heap and len(gain) < -heap[0][0]:
+                heapq.heappush(heap, (-len(gain), difficulty, size, course_id))
+                continue
+            chosen.append((course_id, gain))
+            uncovered -= gain
+
+        chosen.sort(key=lambda item: self.difficulty[item[0]])
+        plan = [(self.courses[course_id], sorted(gain)) for course_id, gain in chosen]
+        return plan, uncovered | unteachable
+
+    def recommend(self, user_skill_ids, job_skill_ids, max_courses=None):
+        """Missing skills for a job plus the course plan that covers them"""
+        missing = self.missing(user_skill_ids, job_skill_ids)
+        plan, uncovered = self.cover(missing, max_courses=max_courses)
+        return {'missing': sorted(missing), 'plan': plan, 'uncovered': sorted(uncovered)}
@@ -0,0 +1,273 @@
+import json
+import threading
+from collections import Counter, OrderedDict, deque
+
+import numpy as np
+
+# Canonical skill name -> aliases, used to seed the Skill table. Canonical
+# names are not scanned for on their own, so ambiguous names like "Go" list
+# only safer aliases.
+SKILL_VOCABULARY = {
+    'Python': ['python', 'python3'],
+    'JavaScript': ['javascript', 'js', 'ecmascript', 'es6'],
+    'TypeScript': ['typescript'],
+    'Java': ['java'],
+    'C++': ['c++', 'cpp'],
+    'C#': ['c#', 'csharp'],
+    'Go': ['golang'],
+    'Rust': ['rust'],
+    'SQL': ['sql'],
+    'PostgreSQL': ['postgresql', 'postgres'],
+    'MySQL': ['mysql'],
+    'MongoDB': ['mongodb', 'mongo'],
+    'HTML/CSS': ['html', 'css', 'html5', 'css3', 'html/css'],
+    'React.js': ['react', 'react.js', 'reactjs'],
+    'Node.js': ['node.js', 'nodejs'],
+    'Angular': ['angular', 'angularjs'],
+    'Vue.js': ['vue', 'vue.js', 'vuejs'],
+    'Flask': ['flask'],
+    'Django': ['django'],
+    'REST APIs': ['rest api', 'rest apis', 'restful'],
+    'Git': ['git', 'github', 'gitlab'],
+    'Docker': ['docker'],
+    'Kubernetes': ['kubernetes', 'k8s'],
+    'AWS': ['aws', 'amazon web services'],
+    'Linux': ['linux', 'unix'],
+    'Machine Learning': ['machine learning', 'ml'],
+    'Deep Learning': ['deep learning'],
+    'ML Algorithms': ['ml algorithms', 'machine learning algorithms'],
+    'NLP': ['nlp', 'natural language processing'],
+    'TensorFlow': ['tensorflow'],
+    'PyTorch': ['pytorch'],
+    'scikit-learn': ['scikit-learn', 'sklearn', 'scikit learn'],
+    'Pandas': ['pandas'],
+    'NumPy': ['numpy'],
+    'Statistics': ['statistics', 'statistical analysis'],
+    'Data Analysis': ['data analysis', 'data analytics'],
+    'Data Visualization': ['data visualization', 'tableau', 'power bi'],
+    'Excel': ['microsoft excel', 'ms excel'],
+    'State Management': ['state management', 'redux'],
+    'Project Management': ['project management', 'agile', 'scrum'],
+    'Communication': ['communication', 'presentation skills'],
+    'Programming fundamentals': ['programming fundamentals'],
+    'Problem solving': ['problem solving', 'problem-solving'],
+}
+
+
+def _is_word_char(char):
+    return char.isalnum() or char in '+#'
+
+
+class AhoCorasick:
+    """Finds every occurrence of many patterns in one left-to-right pass.
+
+    Patterns are lowercase; texts are lowercased before scanning. Only matches
+    on word boundaries are reported, and ``+``/``#`` count as word characters
+    so "c" never matches inside "c++".
+    """
+
+    def __init__(self, patterns):
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        for pattern, value in patterns.items():
+            node = 0
+            for char in pattern:
+                child = self._goto[node].get(char)
+                if child is None:
+                    child = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                    self._goto[node][char] = child
+                node = child
+            self._output[node].append((len(pattern), value))
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def finditer(self, text):
+        """Yield ``(start, end, value)`` for every whole-word match, overlapping included"""
+        text = text.lower()
+        goto, fail, output = self._goto, self._fail, self._output
+        node = 0
+        for end, char in enumerate(text, 1):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for length, value in output[node]:
+                start = end - length
+                if (start == 0 or not _is_word_char(text[start - 1])) and (end == len(text) or not _is_word_char(text[end])):
+                    yield start, end, value
+
+    def longest(self, text):
+        """Leftmost-longest, non-overlapping matches as ``(start, end, value)``"""
+        matches = sorted(self.finditer(text), key=lambda match: (match[0], -match[1]))
+        selected, covered = [], 0
+        for start, end, value in matches:
+            if start >= covered:
+                selected.append((start, end, value))
+                covered = end
+        return selected
+
+
+class SkillTaxonomy:
+    """Canonical skills, an alias automaton and an embedding fallback.
+
+    ``loader`` returns ``(id, name, aliases)`` rows, where ``aliases`` is a
+    list or a JSON array. Everything derived from them is built on first use
+    and rebuilt after ``invalidate``. ``extract`` pulls every known skill out
+    of free text in one pass; ``resolve`` maps a single term to a skill id,
+    falling back to the nearest canonical name by embedding similarity when
+    ``encoder`` returns a model and the term has no exact alias.
+    """
+
+    def __init__(self, loader, encoder=None, fallback_threshold=0.75, fallback_cache_size=10000):
+        self._loader = loader
+        self._encoder = encoder
+        self.fallback_threshold = fallback_threshold
+        self.fallback_cache_size = fallback_cache_size
+        self._lock = threading.Lock()
+        self._state = None
+        self._fallback = OrderedDict()
+        self._fallback_lock = threading.Lock()
+
+    @classmethod
+    def from_vocabulary(cls, vocabulary=SKILL_VOCABULARY, **kwargs):
+        """Taxonomy over an in-memory vocabulary, numbering skills from 1"""
+        rows = [(i, name, aliases) for i, (name, aliases) in enumerate(vocabulary.items(), 1)]
+        return cls(lambda: rows, **kwargs)
+
+    def invalidate(self):
+        with self._lock:
+            self._state = None
+        with self._fallback_lock:
+            self._fallback = OrderedDict()
+
+    def _current(self):
+        state = self._state
+        if state is not None:
+            return state
+        with self._lock:
+            if self._state is None:
+                names, alias_ids, scanned = {}, {}, {}
+                for skill_id, name, aliases in self._loader():
+                    if isinstance(aliases, str):
+                        aliases = json.loads(aliases)
+                    names[skill_id] = name
+                    # Canonical names resolve exactly but only listed aliases are scanned for
+                    alias_ids.setdefault(name.lower(), skill_id)
+                    for alias in aliases or []:
+                        alias_ids.setdefault(alias.lower(), skill_id)
+                        scanned.setdefault(alias.lower(), skill_id)
+                self._state = {
+                    'names': names,
+                    'alias_ids': alias_ids,
+                    'automaton': AhoCorasick(scanned),
+                    'vectors': None
+                }
+            return self._state
+
+    def __len__(self):
+        return len(self._current()['names'])
+
+    def name(self, skill_id):
+        return self._current()['names'].get(skill_id)
+
+    def names(self, skill_ids):
+        names = self._current()['names']
+        return [names[skill_id] for skill_id in skill_ids if skill_id in names]
+
+    def extract(self, text):
+        """Sorted ids of every known skill mentioned in ``text``"""
+        if not text:
+            return []
+        return sorted({skill_id for _, _, skill_id in self._current()['automaton'].longest(text)})
+
+    def find(self, text):
+        """Count mentions of each known skill in ``text``, keyed by canonical name"""
+        state = self._current()
+        return Counter(state['names'][skill_id] for _, _, skill_id in state['automaton'].longest(text))
+
+    def normalize(self, term):
+        """Canonical name for an exact alias, or None"""
+        state = self._current()
+        skill_id = state['alias_ids'].get(term.strip().lower())
+        return state['names'].get(skill_id)
+
+    def resolve(self, term):
+        """Skill id for a term, trying exact aliases then embeddings; None if unknown"""
+        return self.resolve_many([term]).get(term)
+
+    def resolve_many(self, terms):
+        """Map terms to skill ids; unknown terms are embedded in a single batch"""
+        state = self._current()
+        resolved, unknown = {}, []
+        for term in terms:
+            key = term.strip().lower()
+            skill_id = state['alias_ids'].get(key)
+            if skill_id is None:
+                skill_id = self._extract_single(state, key)
+            if skill_id is not None:
+                resolved[term] = skill_id
+                continue
+            with self._fallback_lock:
+                if key in self._fallback:
+                    self._fallback.move_to_end(key)
+                    if self._fallback[key] is not None:
+                        resolved[term] = self._fallback[key]
+                    continue
+            if key:
+                unknown.append((term, key))
+        nearest = self._nearest(state, [key for _, key in unknown]) if unknown else None
+        if nearest is not None:
+            # Only cache real answers, not misses caused by the encoder still loading
+            with self._fallback_lock:
+                for (term, key), skill_id in zip(unknown, nearest):
+                    self._fallback[key] = skill_id
+                    if skill_id is not None:
+                        resolved[term] = skill_id
+                while len(self._fallback) > self.fallback_cache_size:
+                    self._fallback.popitem(last=False)
+        return resolved
+
+    @staticmethod
+    def _extract_single(state, key):
+        """The skill id when a term is exactly one known alias plus noise, e.g. 'React developer'"""
+        ids = {skill_id for _, _, skill_id in state['automaton'].longest(key)}
+        return ids.pop() if len(ids) == 1 else None
+
+    def _nearest(self, state, keys):
+        encoder = self._encoder() if self._encoder else None
+        if encoder is None or not state['names']:
+            return None
+        if state['vectors'] is None:
+            skill_ids = list(state['names'])
+            vectors = np.asarray(encoder.encode(
+                [state['names'][skill_id] for skill_id in skill_ids], normalize_embeddings=True, show_progress_bar=False
+            ), dtype='float32')
+            state['vectors'] = (np.array(skill_ids), vectors)
+        skill_ids, vectors = state['vectors']
+        queries = np.asarray(encoder.encode(keys, normalize_embeddings=True, show_progress_bar=False), dtype='float32')
+        similarities = queries @ vectors.T
+        best = similarities.argmax(axis=1)
+        return [
+            int(skill_ids[column]) if similarities[row, column] >= self.fallback_threshold else None
+            for row, column in enumerate(best)
+        ]
+
+
+def overlap_score(user_skill_ids, job_skill_ids):
+    """Share of the user's skills that the job asks for, 0-100, by id intersection"""
+    user_skill_ids = set(user_skill_ids)
+    if not user_skill_ids:
+        return 0
+    return len(user_skill_ids & set(job_skill_ids)) / len(user_skill_ids) * 100